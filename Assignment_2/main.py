@@ -10,6 +10,8 @@ Usage:
 """
 
 import argparse
+import io
+import sys
 import time
 from decimal import Decimal
 from pathlib import Path
@@ -63,64 +65,28 @@ def run_all_analyses(data_file: str) -> None:
     print()
     print("=" * 80)
 
+    # Render the report into memory and write it to stdout once
+    report = io.StringIO()
+
     # Run all analyses
     analysis_start = time.time()
 
-    # Analysis 1: Revenue by Category
-    result_01 = analyses.analysis_01_revenue_by_category(transactions)
-    formatters.format_analysis_01(result_01)
-
-    # Analysis 2: Top Products by Volume
-    result_02 = analyses.analysis_02_top_products_by_volume(transactions, top_n=10)
-    formatters.format_analysis_02(result_02)
-
-    # Analysis 3: Average Transaction by Segment
-    result_03 = analyses.analysis_03_avg_transaction_by_segment(transactions)
-    formatters.format_analysis_03(result_03)
-
-    # Analysis 4: Monthly Sales Trend
-    result_04 = analyses.analysis_04_monthly_sales_trend(transactions)
-    formatters.format_analysis_04(result_04)
-
-    # Analysis 5: Revenue by Region and Payment
-    result_05 = analyses.analysis_05_revenue_by_region_and_payment(transactions)
-    formatters.format_analysis_05(result_05)
-
-    # Analysis 6: Discount Impact
-    result_06 = analyses.analysis_06_discount_impact(transactions)
-    formatters.format_analysis_06(result_06)
-
-    # Analysis 7: Sales Rep Performance
-    result_07 = analyses.analysis_07_sales_rep_performance(transactions, top_n=10)
-    formatters.format_analysis_07(result_07)
-
-    # Analysis 8: Customer Purchase Frequency
-    result_08 = analyses.analysis_08_customer_purchase_frequency(transactions)
-    formatters.format_analysis_08(result_08)
-
-    # Analysis 9: Seasonal Pattern
-    result_09 = analyses.analysis_09_seasonal_pattern(transactions)
-    formatters.format_analysis_09(result_09)
-
-    # Analysis 10: High-Value Transactions
-    result_10 = analyses.analysis_10_high_value_transactions(transactions, percentile=95.0)
-    formatters.format_analysis_10(result_10)
-
-    # Analysis 11: Category Mix by Region
-    result_11 = analyses.analysis_11_category_mix_by_region(transactions)
-    formatters.format_analysis_11(result_11)
-
-    # Analysis 12: Customer Lifetime Value
-    result_12 = analyses.analysis_12_customer_lifetime_value(transactions, top_n=20)
-    formatters.format_analysis_12(result_12)
-
-    # Analysis 13: Payment Preference by Segment
-    result_13 = analyses.analysis_13_payment_preference_by_segment(transactions)
-    formatters.format_analysis_13(result_13)
-
-    # Analysis 14: Price Range Distribution
-    result_14 = analyses.analysis_14_price_range_distribution(transactions)
-    formatters.format_analysis_14(result_14)
+    results = analyses.run_all(transactions)
+
+    formatters.format_analysis_01(results["01"], file=report)
+    formatters.format_analysis_02(results["02"], file=report)
+    formatters.format_analysis_03(results["03"], file=report)
+    formatters.format_analysis_04(results["04"], file=report)
+    formatters.format_analysis_05(results["05"], file=report)
+    formatters.format_analysis_06(results["06"], file=report)
+    formatters.format_analysis_07(results["07"], file=report)
+    formatters.format_analysis_08(results["08"], file=report)
+    formatters.format_analysis_09(results["09"], file=report)
+    formatters.format_analysis_10(results["10"], file=report)
+    formatters.format_analysis_11(results["11"], file=report)
+    formatters.format_analysis_12(results["12"], file=report)
+    formatters.format_analysis_13(results["13"], file=report)
+    formatters.format_analysis_14(results["14"], file=report)
 
     analysis_time = time.time() - analysis_start
 
@@ -130,7 +96,9 @@ def run_all_analyses(data_file: str) -> None:
         total_revenue=total_revenue,
         date_range=date_range,
         execution_time=analysis_time,
+        file=report,
     )
+    sys.stdout.write(report.getvalue())
 
     print("✓ All analyses completed successfully!")
     print()
@@ -12,6 +12,7 @@ Core Components:
     - grouping: Group-by and partition operations
     - filtering: Predicate-based filtering
     - transformations: Map and extract operations
+    - batch: Columnar (struct-of-arrays) transaction batches
     - analyses: 14 comprehensive analysis functions
     - formatters: Console output formatting
 """
@@ -16,12 +16,35 @@ from collections import Counter
 from collections.abc import Iterable
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any
 
 from .aggregations import avg_by, count_by, percentile_by, sum_by
 from .data_loader import SalesTransaction
 from .filtering import filter_by, filter_top_n
-from .grouping import count_by_key, group_and_aggregate, group_by, nested_group_by
+from .grouping import (
+    count_by_key,
+    group_and_aggregate,
+    group_by,
+    nested_group_by,
+    partition_by,
+)
+
+
+# Date-derived keys are memoized per date string: a dataset repeats a few
+# hundred distinct dates across many rows, so each is parsed once. The
+# cache is bounded by the number of calendar days seen.
+@lru_cache(maxsize=None)
+def _year_month(date_str: str) -> str:
+    """Extract YYYY-MM from a YYYY-MM-DD date string."""
+    return datetime.strptime(date_str, "%Y-%m-%d").strftime("%Y-%m")
+
+
+@lru_cache(maxsize=None)
+def _year_quarter(date_str: str) -> tuple[str, str]:
+    """Extract (year, quarter) such as ("2023", "Q2") from a YYYY-MM-DD date."""
+    date = datetime.strptime(date_str, "%Y-%m-%d")
+    return str(date.year), f"Q{(date.month - 1) // 3 + 1}"
 
 
 def analysis_01_revenue_by_category(
@@ -59,7 +82,7 @@ def analysis_02_top_products_by_volume(
     """
     Analysis 2: Top N Products by Sales Volume.
 
-    Demonstrates: grouping + sorting + slicing
+    Demonstrates: grouping + heap-based top-N selection
 
     Args:
         transactions: Iterable of sales transactions
@@ -68,7 +91,7 @@ def analysis_02_top_products_by_volume(
     Returns:
         List of (product_id, product_name, total_quantity) tuples
 
-    Time Complexity: O(n + k log k) where k is number of products
+    Time Complexity: O(n + k log top_n) where k is number of products
     """
     # Group by product and sum quantities
     product_volumes: dict[str, tuple[str, int]] = {}
@@ -81,15 +104,13 @@ def analysis_02_top_products_by_volume(
         name, quantity = product_volumes[pid]
         product_volumes[pid] = (name, quantity + transaction.quantity)
 
-    # Sort by quantity and take top N
-    sorted_products = sorted(
-        [(pid, name, qty) for pid, (name, qty) in product_volumes.items()],
+    # Take top N by quantity without sorting every product
+    return filter_top_n(
+        ((pid, name, qty) for pid, (name, qty) in product_volumes.items()),
         key=lambda x: x[2],
-        reverse=True,
+        n=top_n,
     )
 
-    return sorted_products[:top_n]
-
 
 def analysis_03_avg_transaction_by_segment(
     transactions: Iterable[SalesTransaction],
@@ -133,8 +154,7 @@ def analysis_04_monthly_sales_trend(
 
     def extract_year_month(transaction: SalesTransaction) -> str:
         """Extract YYYY-MM from transaction date."""
-        date = datetime.strptime(transaction.date, "%Y-%m-%d")
-        return date.strftime("%Y-%m")
+        return _year_month(transaction.date)
 
     monthly_revenue = group_and_aggregate(
         transactions,
@@ -196,11 +216,10 @@ def analysis_06_discount_impact(
 
     Time Complexity: O(n)
     """
-    trans_list = list(transactions)
-
-    # Partition into discounted and non-discounted
-    discounted = [t for t in trans_list if t.discount_percent > 0]
-    non_discounted = [t for t in trans_list if t.discount_percent == 0]
+    # Partition into discounted and non-discounted in a single pass
+    discounted, non_discounted = partition_by(
+        transactions, lambda t: t.discount_percent > 0
+    )
 
     result: dict[str, Any] = {
         "discounted_count": len(discounted),
@@ -248,7 +267,7 @@ def analysis_07_sales_rep_performance(
     Returns:
         List of (sales_rep_id, metrics_dict) tuples
 
-    Time Complexity: O(n + k log k) where k is number of reps
+    Time Complexity: O(n + k log top_n) where k is number of reps
     """
     # Filter out transactions without sales rep
     valid_transactions = list(
@@ -277,9 +296,8 @@ def analysis_07_sales_rep_performance(
 
         performance.append((rep_id, metrics))
 
-    # Sort by total revenue descending and take top N
-    performance.sort(key=lambda x: x[1]["total_revenue"], reverse=True)
-    return performance[:top_n]
+    # Take top N by total revenue (heap selection, same order as a stable sort)
+    return filter_top_n(performance, key=lambda x: x[1]["total_revenue"], n=top_n)
 
 
 def analysis_08_customer_purchase_frequency(
@@ -348,10 +366,7 @@ def analysis_09_seasonal_pattern(
 
     def extract_year_quarter(transaction: SalesTransaction) -> tuple[str, str]:
         """Extract (year, quarter) from transaction date."""
-        date = datetime.strptime(transaction.date, "%Y-%m-%d")
-        year = str(date.year)
-        quarter = f"Q{(date.month - 1) // 3 + 1}"
-        return year, quarter
+        return _year_quarter(transaction.date)
 
     trans_list = list(transactions)
 
@@ -481,7 +496,7 @@ def analysis_12_customer_lifetime_value(
     Returns:
         List of (customer_id, metrics) tuples
 
-    Time Complexity: O(n + k log k) where k is number of customers
+    Time Complexity: O(n + k log top_n) where k is number of customers
     """
     # Filter valid customers
     valid_transactions = list(
@@ -510,9 +525,8 @@ def analysis_12_customer_lifetime_value(
 
         customer_metrics.append((customer_id, metrics))
 
-    # Sort by total revenue and take top N
-    customer_metrics.sort(key=lambda x: x[1]["total_revenue"], reverse=True)
-    return customer_metrics[:top_n]
+    # Take top N by total revenue
+    return filter_top_n(customer_metrics, key=lambda x: x[1]["total_revenue"], n=top_n)
 
 
 def analysis_13_payment_preference_by_segment(
@@ -598,3 +612,41 @@ def analysis_14_price_range_distribution(
         bucket_data["revenue"] = bucket_data["revenue"] + revenue
 
     return buckets
+
+
+def run_all(transactions: Iterable[SalesTransaction]) -> dict[str, Any]:
+    """
+    Run all 14 analyses with their default parameters.
+
+    The input is materialized once, so generators can be passed and every
+    analysis shares the same list (and the memoized date keys of 4 and 9).
+
+    Args:
+        transactions: Iterable of sales transactions
+
+    Returns:
+        Dictionary mapping analysis number ("01".."14") to its result
+
+    Example:
+        >>> results = run_all(transactions)
+        >>> results["01"]  # revenue by category
+        [('Electronics', Decimal('...')), ...]
+    """
+    trans_list = list(transactions)
+
+    return {
+        "01": analysis_01_revenue_by_category(trans_list),
+        "02": analysis_02_top_products_by_volume(trans_list),
+        "03": analysis_03_avg_transaction_by_segment(trans_list),
+        "04": analysis_04_monthly_sales_trend(trans_list),
+        "05": analysis_05_revenue_by_region_and_payment(trans_list),
+        "06": analysis_06_discount_impact(trans_list),
+        "07": analysis_07_sales_rep_performance(trans_list),
+        "08": analysis_08_customer_purchase_frequency(trans_list),
+        "09": analysis_09_seasonal_pattern(trans_list),
+        "10": analysis_10_high_value_transactions(trans_list),
+        "11": analysis_11_category_mix_by_region(trans_list),
+        "12": analysis_12_customer_lifetime_value(trans_list),
+        "13": analysis_13_payment_preference_by_segment(trans_list),
+        "14": analysis_14_price_range_distribution(trans_list),
+    }
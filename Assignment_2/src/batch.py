@@ -0,0 +1,418 @@
+"""
+Columnar Batch Module.
+
+Provides a struct-of-arrays representation of sales transactions:
+- One contiguous column per field instead of one object per row
+- Money stored as integer cents in array('q') (no Decimal per value)
+- Boolean masks for columnar filtering
+
+Scanning a single column (e.g. total_amount_cents) touches only that
+column's buffer, rather than every field of every SalesTransaction.
+The row-oriented API in data_loader remains the primary interface;
+batches convert to and from it losslessly.
+"""
+
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, fields
+from decimal import Decimal
+from functools import cached_property
+from typing import Any, Optional, Union, cast
+
+from .data_loader import (
+    SalesTransaction,
+    parse_cents,
+    parse_float,
+    parse_int,
+    parse_optional_string,
+)
+from .filtering import date_to_int, filter_by_mask, filter_range_mask
+
+# array[...] is only valid for type checkers here, so those annotations are quoted
+Column = Union["array[int]", "array[float]", tuple[Optional[str], ...]]
+
+_CENTS = Decimal(100)
+
+
+def to_cents(amount: Decimal) -> int:
+    """
+    Convert a Decimal money amount to integer cents.
+
+    Args:
+        amount: Monetary amount with at most 2 decimal places
+
+    Returns:
+        Amount in cents
+
+    Raises:
+        ValueError: If amount has sub-cent precision
+
+    Example:
+        >>> to_cents(Decimal('19.99'))
+        1999
+    """
+    cents = amount * _CENTS
+    if cents != cents.to_integral_value():
+        raise ValueError(f"Cannot represent '{amount}' in whole cents")
+    return int(cents)
+
+
+def from_cents(cents: int) -> Decimal:
+    """
+    Convert integer cents back to a 2-place Decimal amount.
+
+    Example:
+        >>> from_cents(1999)
+        Decimal('19.99')
+    """
+    return Decimal(cents).scaleb(-2)
+
+
+@dataclass(frozen=True)
+class SalesBatch:
+    """
+    Immutable columnar batch of sales transactions.
+
+    Each attribute holds one column, all of equal length (checked on
+    construction). Numeric columns are typed arrays; string columns are
+    tuples.
+
+    Attributes:
+        transaction_id: Unique transaction identifiers
+        date: Transaction dates (YYYY-MM-DD)
+        timestamp: Full timestamps
+        customer_id: Customer identifiers (None where missing)
+        product_id: Product SKUs
+        product_category: Product categories
+        product_name: Product names
+        quantity: Units sold (array of int64)
+        unit_price_cents: Price per unit in cents (array of int64)
+        total_amount_cents: Total transaction amount in cents (array of int64)
+        discount_percent: Discount percentages (array of float64)
+        payment_method: Payment methods
+        region: Geographic regions
+        sales_rep_id: Sales representative IDs (None where missing)
+        customer_segment: Customer segments
+    """
+
+    transaction_id: tuple[str, ...]
+    date: tuple[str, ...]
+    timestamp: tuple[str, ...]
+    customer_id: tuple[Optional[str], ...]
+    product_id: tuple[str, ...]
+    product_category: tuple[str, ...]
+    product_name: tuple[str, ...]
+    quantity: "array[int]"
+    unit_price_cents: "array[int]"
+    total_amount_cents: "array[int]"
+    discount_percent: "array[float]"
+    payment_method: tuple[str, ...]
+    region: tuple[str, ...]
+    sales_rep_id: tuple[Optional[str], ...]
+    customer_segment: tuple[str, ...]
+
+    # Columns compare by value, but arrays are mutable and unhashable, so
+    # opt out of the __hash__ that frozen dataclasses would otherwise add
+    __hash__ = None  # type: ignore[assignment]
+
+    def __post_init__(self) -> None:
+        """Reject batches whose columns differ in length."""
+        lengths = {f.name: len(getattr(self, f.name)) for f in fields(self)}
+        if len(set(lengths.values())) > 1:
+            raise ValueError(f"Columns have different lengths: {lengths}")
+
+    @classmethod
+    def from_transactions(
+        cls, transactions: Iterable[SalesTransaction]
+    ) -> "SalesBatch":
+        """
+        Build a batch from row-oriented transactions.
+
+        Args:
+            transactions: Iterable of SalesTransaction records
+
+        Returns:
+            SalesBatch with one column per field
+
+        Raises:
+            ValueError: If a monetary amount has sub-cent precision
+        """
+        rows = list(transactions)
+        if not rows:
+            return cls.empty()
+
+        (
+            transaction_id,
+            date,
+            timestamp,
+            customer_id,
+            product_id,
+            product_category,
+            product_name,
+            quantity,
+            unit_price,
+            total_amount,
+            discount_percent,
+            payment_method,
+            region,
+            sales_rep_id,
+            customer_segment,
+        ) = zip(*rows)
+
+        return cls(
+            transaction_id=transaction_id,
+            date=date,
+            timestamp=timestamp,
+            customer_id=customer_id,
+            product_id=product_id,
+            product_category=product_category,
+            product_name=product_name,
+            quantity=array("q", quantity),
+            unit_price_cents=array("q", map(to_cents, unit_price)),
+            total_amount_cents=array("q", map(to_cents, total_amount)),
+            discount_percent=array("d", discount_percent),
+            payment_method=payment_method,
+            region=region,
+            sales_rep_id=sales_rep_id,
+            customer_segment=customer_segment,
+        )
+
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, Sequence[str]]) -> "SalesBatch":
+        """
+        Build a batch from raw string columns (e.g. load_csv_columns output).
+
+        Args:
+            columns: Mapping of CSV column name to its string values
+
+        Returns:
+            SalesBatch with parsed, typed columns
+
+        Raises:
+            ValueError: If a required column is missing or a value is invalid
+        """
+        try:
+            row_count = len(columns["transaction_id"])
+            # Optional columns may be absent, as in load_csv
+            missing = ("",) * row_count
+            return cls(
+                transaction_id=tuple(columns["transaction_id"]),
+                date=tuple(columns["date"]),
+                timestamp=tuple(columns["timestamp"]),
+                customer_id=tuple(
+                    map(parse_optional_string, columns.get("customer_id", missing))
+                ),
+                product_id=tuple(columns["product_id"]),
+                product_category=tuple(map(sys.intern, columns["product_category"])),
+                product_name=tuple(columns["product_name"]),
+                quantity=array("q", map(parse_int, columns["quantity"])),
+                unit_price_cents=array("q", map(parse_cents, columns["unit_price"])),
+                total_amount_cents=array(
+                    "q", map(parse_cents, columns["total_amount"])
+                ),
+                discount_percent=array(
+                    "d", map(parse_float, columns["discount_percent"])
+                ),
+                payment_method=tuple(map(sys.intern, columns["payment_method"])),
+                region=tuple(map(sys.intern, columns["region"])),
+                sales_rep_id=tuple(
+                    map(parse_optional_string, columns.get("sales_rep_id", missing))
+                ),
+                customer_segment=tuple(map(sys.intern, columns["customer_segment"])),
+            )
+        except KeyError as e:
+            raise ValueError(f"Missing required column: {e}") from e
+
+    @classmethod
+    def empty(cls) -> "SalesBatch":
+        """Create a batch with no rows."""
+        return cls(
+            transaction_id=(),
+            date=(),
+            timestamp=(),
+            customer_id=(),
+            product_id=(),
+            product_category=(),
+            product_name=(),
+            quantity=array("q"),
+            unit_price_cents=array("q"),
+            total_amount_cents=array("q"),
+            discount_percent=array("d"),
+            payment_method=(),
+            region=(),
+            sales_rep_id=(),
+            customer_segment=(),
+        )
+
+    @cached_property
+    def date_key(self) -> "array[int]":
+        """
+        Dates as YYYYMMDD integers (array of int64), computed on first use.
+
+        Derived from the date column rather than stored as a field, so
+        batches only pay for the conversion when date filtering is used.
+        """
+        return array("q", map(date_to_int, self.date))
+
+    def __len__(self) -> int:
+        """Number of rows, read from one column's length in O(1)."""
+        return len(self.transaction_id)
+
+    def transactions(self) -> Iterator[SalesTransaction]:
+        """
+        Iterate over the batch as row-oriented SalesTransaction records.
+
+        Yields:
+            SalesTransaction for each row, with cents converted back to Decimal
+        """
+        for row in zip(
+            self.transaction_id,
+            self.date,
+            self.timestamp,
+            self.customer_id,
+            self.product_id,
+            self.product_category,
+            self.product_name,
+            self.quantity,
+            map(from_cents, self.unit_price_cents),
+            map(from_cents, self.total_amount_cents),
+            self.discount_percent,
+            self.payment_method,
+            self.region,
+            self.sales_rep_id,
+            self.customer_segment,
+        ):
+            yield SalesTransaction._make(row)
+
+
+def _column(batch: SalesBatch, name: str) -> Column:
+    """Look up a batch column by name, rejecting unknown names."""
+    if name not in batch.__dataclass_fields__:
+        raise ValueError(f"Unknown column: {name}")
+    return cast(Column, getattr(batch, name))
+
+
+def filter_mask(
+    batch: SalesBatch,
+    column: str,
+    min_val: Union[int, float],
+    max_val: Union[int, float],
+    inclusive: bool = True,
+) -> list[bool]:
+    """
+    Build a row mask for values of one numeric column within a range.
+
+    Only the named column is scanned; apply the result with apply_mask.
+
+    Args:
+        batch: Source batch
+        column: Name of a numeric column (e.g. "total_amount_cents")
+        min_val: Minimum value (inclusive or exclusive)
+        max_val: Maximum value (inclusive or exclusive)
+        inclusive: Whether bounds are inclusive
+
+    Returns:
+        List of booleans, one per row
+
+    Raises:
+        ValueError: If column is not a numeric batch column
+
+    Time Complexity: O(n)
+    Space Complexity: O(n)
+
+    Example:
+        >>> mask = filter_mask(batch, "total_amount_cents", 10_000, 20_000)
+        >>> mid_range = apply_mask(batch, mask)
+    """
+    values = _column(batch, column)
+    if not isinstance(values, array):
+        raise ValueError(f"Column is not numeric: {column}")
+    return filter_range_mask(values, min_val, max_val, inclusive)
+
+
+def filter_date_mask(batch: SalesBatch, start_date: str, end_date: str) -> list[bool]:
+    """
+    Build a row mask for transactions dated within [start_date, end_date].
+
+    Compares the batch's integer date_key column, so each row costs one
+    integer comparison instead of a date parse.
+
+    Args:
+        batch: Source batch
+        start_date: Inclusive start date (YYYY-MM-DD)
+        end_date: Inclusive end date (YYYY-MM-DD)
+
+    Returns:
+        List of booleans, one per row
+
+    Raises:
+        ValueError: If a bound or a batch date is not a valid date
+
+    Example:
+        >>> q1 = apply_mask(batch, filter_date_mask(batch, "2023-01-01", "2023-03-31"))
+    """
+    return filter_range_mask(
+        batch.date_key, date_to_int(start_date), date_to_int(end_date)
+    )
+
+
+def apply_mask(batch: SalesBatch, mask: Sequence[bool]) -> SalesBatch:
+    """
+    Select the rows of a batch where mask is True.
+
+    Args:
+        batch: Source batch
+        mask: One boolean per row (e.g. from filter_mask)
+
+    Returns:
+        New SalesBatch containing only the selected rows
+
+    Raises:
+        ValueError: If mask length differs from the batch length
+
+    Time Complexity: O(n * k) for n rows and k columns
+    Space Complexity: O(m * k) for m selected rows
+    """
+    if len(mask) != len(batch):
+        raise ValueError(f"Mask has {len(mask)} entries, batch has {len(batch)} rows")
+
+    # Values are typed per field by SalesBatch itself; Any avoids restating them
+    selected: dict[str, Any] = {}
+    for f in fields(batch):
+        column = getattr(batch, f.name)
+        if isinstance(column, array):
+            selected[f.name] = array(column.typecode, filter_by_mask(column, mask))
+        else:
+            selected[f.name] = tuple(filter_by_mask(column, mask))
+    return SalesBatch(**selected)
+
+
+def validate_batch(batch: SalesBatch) -> list[bool]:
+    """
+    Validate business rules for every row of a batch.
+
+    Columnar counterpart of data_loader.validate_transaction, applying the
+    same checks by zipping just the four columns involved:
+    - Quantity is positive
+    - Prices are non-negative
+    - Discount is within valid range
+
+    Args:
+        batch: Batch to validate
+
+    Returns:
+        List of booleans, True where the row is valid (usable with apply_mask)
+
+    Time Complexity: O(n)
+    Space Complexity: O(n)
+    """
+    return [
+        quantity > 0 and unit_price >= 0 and total >= 0 and 0 <= discount <= 100
+        for quantity, unit_price, total, discount in zip(
+            batch.quantity,
+            batch.unit_price_cents,
+            batch.total_amount_cents,
+            batch.discount_percent,
+        )
+    ]
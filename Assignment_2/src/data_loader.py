@@ -2,27 +2,31 @@
 Data Loader Module.
 
 Provides CSV parsing functionality using functional programming principles.
-Uses namedtuple for immutable data records and csv.DictReader for lazy evaluation.
+Uses namedtuple for immutable data records and csv.reader for lazy evaluation.
 
 Key Features:
     - Lazy evaluation: Processes data as iterator, not loading all into memory
     - Immutability: namedtuple ensures data cannot be modified
     - Type safety: Strong typing with Decimal for monetary values
     - Validation: Handles missing and malformed data gracefully
+    - Columnar loading: load_csv_columns transposes rows into column tuples
 """
 
 import csv
-from collections.abc import Iterator
-from dataclasses import dataclass
+import sys
+from collections.abc import Callable, Iterator, Mapping, Sequence
 from decimal import Decimal, InvalidOperation
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional
 
 
-@dataclass(frozen=True)
-class SalesTransaction:
+class SalesTransaction(NamedTuple):
     """
-    Immutable data class representing a single sales transaction.
+    Immutable record representing a single sales transaction.
+
+    A NamedTuple rather than a frozen dataclass: instances carry no
+    per-instance __dict__, and field access is a C-level tuple lookup.
 
     Attributes:
         transaction_id: Unique transaction identifier
@@ -59,6 +63,16 @@ class SalesTransaction:
     customer_segment: str
 
 
+# CSV column names, in SalesTransaction field order
+COLUMNS: tuple[str, ...] = SalesTransaction._fields
+
+# Columns that may be absent from the header (parsed as None)
+OPTIONAL_COLUMNS = frozenset({"customer_id", "sales_rep_id"})
+
+# Read buffer for CSV files: fewer read() calls than the 8 KiB default
+READ_BUFFER_SIZE = 1 << 20
+
+
 def parse_decimal(value: str) -> Decimal:
     """
     Parse string to Decimal with error handling.
@@ -78,6 +92,45 @@ def parse_decimal(value: str) -> Decimal:
         raise ValueError(f"Cannot parse '{value}' as decimal") from e
 
 
+def parse_cents(value: str) -> int:
+    """
+    Parse a money string to integer minor units (cents).
+
+    Avoids Decimal construction entirely: the digits either side of the
+    decimal point are joined and converted with a single int() call.
+    Amounts with more than two fractional digits are rejected rather than
+    silently truncated.
+
+    Args:
+        value: String representation of a monetary amount (e.g. "19.99")
+
+    Returns:
+        Amount in cents (e.g. 1999)
+
+    Raises:
+        ValueError: If value is not a plain decimal with at most 2 places
+
+    Example:
+        >>> parse_cents("19.9")
+        1990
+    """
+    text = value.strip()
+    sign = -1 if text.startswith("-") else 1
+    if text[:1] in ("-", "+"):
+        text = text[1:]
+
+    whole, _, frac = text.partition(".")
+    digits = whole + frac.ljust(2, "0")
+    if (
+        not (whole or frac)
+        or len(frac) > 2
+        or not (digits.isascii() and digits.isdigit())
+    ):
+        raise ValueError(f"Cannot parse '{value}' as cents")
+
+    return sign * int(digits)
+
+
 def parse_int(value: str) -> int:
     """
     Parse string to integer with error handling.
@@ -126,13 +179,18 @@ def parse_optional_string(value: str) -> Optional[str]:
     Returns:
         String or None if empty
     """
-    return value.strip() if value.strip() else None
+    # str.strip() returns the same object when there is nothing to strip
+    stripped = value.strip()
+    return stripped or None
 
 
 def parse_row(row: dict[str, str]) -> SalesTransaction:
     """
     Parse a CSV row dictionary into a SalesTransaction.
 
+    Low-cardinality categorical fields (category, payment method, region,
+    segment) are interned so repeated values share a single string object.
+
     Args:
         row: Dictionary from csv.DictReader
 
@@ -150,21 +208,109 @@ def parse_row(row: dict[str, str]) -> SalesTransaction:
             timestamp=row["timestamp"],
             customer_id=parse_optional_string(row.get("customer_id", "")),
             product_id=row["product_id"],
-            product_category=row["product_category"],
+            product_category=sys.intern(row["product_category"]),
             product_name=row["product_name"],
             quantity=parse_int(row["quantity"]),
             unit_price=parse_decimal(row["unit_price"]),
             total_amount=parse_decimal(row["total_amount"]),
             discount_percent=parse_float(row["discount_percent"]),
-            payment_method=row["payment_method"],
-            region=row["region"],
+            payment_method=sys.intern(row["payment_method"]),
+            region=sys.intern(row["region"]),
             sales_rep_id=parse_optional_string(row.get("sales_rep_id", "")),
-            customer_segment=row["customer_segment"],
+            customer_segment=sys.intern(row["customer_segment"]),
         )
     except KeyError as e:
         raise ValueError(f"Missing required column: {e}") from e
 
 
+def make_extractor(
+    columns: Mapping[str, int],
+) -> Callable[[Sequence[str]], tuple[str, ...]]:
+    """
+    Build a function that pulls the COLUMNS fields out of a positional row.
+
+    The header is validated once here, so per-row extraction needs no
+    key checks: when every column is present the extractor is a single
+    operator.itemgetter call running in C.
+
+    Args:
+        columns: Mapping of column name to position, built from the header
+
+    Returns:
+        Function mapping a csv.reader row to its fields in COLUMNS order
+        (missing optional columns yield "")
+
+    Raises:
+        ValueError: If a required column is missing from the header
+
+    Example:
+        >>> extract = make_extractor({name: i for i, name in enumerate(header)})
+        >>> fields = extract(row)
+    """
+    for name in COLUMNS:
+        if name not in columns and name not in OPTIONAL_COLUMNS:
+            raise ValueError(f"Missing required column: {name}")
+
+    if all(name in columns for name in COLUMNS):
+        return itemgetter(*(columns[name] for name in COLUMNS))
+
+    indices = tuple(columns.get(name) for name in COLUMNS)
+    return lambda row: tuple("" if i is None else row[i] for i in indices)
+
+
+def parse_fields(fields: Sequence[str]) -> SalesTransaction:
+    """
+    Parse raw field strings, ordered as COLUMNS, into a SalesTransaction.
+
+    Low-cardinality categorical fields are interned so repeated values
+    share a single string object.
+
+    Args:
+        fields: Field values in COLUMNS order (e.g. from make_extractor)
+
+    Returns:
+        SalesTransaction instance
+
+    Raises:
+        ValueError: If a numeric field cannot be parsed
+    """
+    (
+        transaction_id,
+        date,
+        timestamp,
+        customer_id,
+        product_id,
+        product_category,
+        product_name,
+        quantity,
+        unit_price,
+        total_amount,
+        discount_percent,
+        payment_method,
+        region,
+        sales_rep_id,
+        customer_segment,
+    ) = fields
+
+    return SalesTransaction(
+        transaction_id,
+        date,
+        timestamp,
+        parse_optional_string(customer_id),
+        product_id,
+        sys.intern(product_category),
+        product_name,
+        parse_int(quantity),
+        parse_decimal(unit_price),
+        parse_decimal(total_amount),
+        parse_float(discount_percent),
+        sys.intern(payment_method),
+        sys.intern(region),
+        parse_optional_string(sales_rep_id),
+        sys.intern(customer_segment),
+    )
+
+
 def load_csv(file_path: str) -> Iterator[SalesTransaction]:
     """
     Load sales data from CSV file as lazy iterator.
@@ -182,7 +328,7 @@ def load_csv(file_path: str) -> Iterator[SalesTransaction]:
 
     Raises:
         FileNotFoundError: If CSV file doesn't exist
-        ValueError: If CSV has invalid data
+        ValueError: If the header is missing a required column
 
     Time Complexity: O(1) per row yielded
     Space Complexity: O(1) - constant memory usage
@@ -196,17 +342,33 @@ def load_csv(file_path: str) -> Iterator[SalesTransaction]:
     if not csv_file.exists():
         raise FileNotFoundError(f"CSV file not found: {file_path}")
 
-    with csv_file.open("r", encoding="utf-8") as file:
-        reader = csv.DictReader(file)
-
-        for row_num, row in enumerate(reader, start=2):  # Start at 2 (after header)
+    # newline="" hands raw line endings to csv, as the csv docs require
+    with csv_file.open(
+        "r", encoding="utf-8", newline="", buffering=READ_BUFFER_SIZE
+    ) as file:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:  # Completely empty file
+            return
+
+        # Header validated once; rows stay tuples-of-strings
+        columns = {name: index for index, name in enumerate(header)}
+        extract = make_extractor(columns)
+
+        for row in reader:
+            if not row:  # Blank line
+                continue
             try:
-                yield parse_row(row)
-            except (ValueError, KeyError) as e:
+                yield parse_fields(extract(row))
+            except IndexError:
+                print(
+                    f"Warning: Skipping row {reader.line_num}: "
+                    f"Row has {len(row)} fields, expected {len(columns)}"
+                )
+            except ValueError as e:
                 # Log error but continue processing (robustness)
                 # In production, might want to collect errors or fail fast
-                print(f"Warning: Skipping row {row_num}: {e}")
-                continue
+                print(f"Warning: Skipping row {reader.line_num}: {e}")
 
 
 def load_csv_as_list(file_path: str) -> list[SalesTransaction]:
@@ -232,6 +394,59 @@ def load_csv_as_list(file_path: str) -> list[SalesTransaction]:
     return list(load_csv(file_path))
 
 
+def load_csv_columns(file_path: str) -> dict[str, tuple[str, ...]]:
+    """
+    Load a CSV file column-wise as raw string tuples.
+
+    Rows are read with csv.reader and transposed with zip(*rows), which
+    runs in C and builds no per-row dicts or SalesTransaction objects.
+    Use this when an analysis needs only a few columns; convert the
+    values it needs (e.g. with parse_cents or parse_int) afterwards.
+
+    Args:
+        file_path: Path to CSV file
+
+    Returns:
+        Dict mapping each header name to a tuple of its column values
+
+    Raises:
+        FileNotFoundError: If CSV file doesn't exist
+        ValueError: If a row's length differs from the header's
+
+    Time Complexity: O(n * k) for n rows and k columns
+    Space Complexity: O(n * k)
+
+    Example:
+        >>> columns = load_csv_columns('data/sales_data.csv')
+        >>> categories = set(columns['product_category'])
+    """
+    csv_file = Path(file_path)
+
+    if not csv_file.exists():
+        raise FileNotFoundError(f"CSV file not found: {file_path}")
+
+    with csv_file.open(
+        "r", encoding="utf-8", newline="", buffering=READ_BUFFER_SIZE
+    ) as file:
+        reader = csv.reader(file)
+        header = next(reader, [])
+        rows = [row for row in reader if row]  # Skip blank lines
+
+    if not rows:
+        return {name: () for name in header}
+
+    try:
+        columns = tuple(zip(*rows, strict=True))
+    except ValueError as e:
+        raise ValueError("CSV rows have inconsistent column counts") from e
+    if len(columns) != len(header):
+        raise ValueError(
+            f"CSV rows have {len(columns)} columns, header has {len(header)}"
+        )
+
+    return dict(zip(header, columns))
+
+
 def validate_transaction(transaction: SalesTransaction) -> bool:
     """
     Validate transaction business logic.
@@ -11,13 +11,17 @@ Demonstrates functional filter patterns and lambda expressions.
 """
 
 from collections.abc import Callable, Iterable
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
+from heapq import nlargest, nsmallest
+from itertools import compress, filterfalse
 from typing import Any, TypeVar, Union
 
 T = TypeVar("T")
 NumericType = Union[int, float, Decimal]
 
+ISO_DATE_FORMAT = "%Y-%m-%d"
+
 
 def filter_by(iterable: Iterable[T], predicate: Callable[[T], bool]) -> Iterable[T]:
     """
@@ -63,11 +67,33 @@ def exclude_by(iterable: Iterable[T], predicate: Callable[[T], bool]) -> Iterabl
         >>> list(exclude_by(data, lambda x: x % 2 == 0))
         [1, 3, 5]
     """
-    from itertools import filterfalse
-
     return filterfalse(predicate, iterable)
 
 
+def filter_by_mask(iterable: Iterable[T], mask: Iterable[bool]) -> Iterable[T]:
+    """
+    Select elements whose corresponding mask entry is truthy.
+
+    Wrapper around itertools.compress, for masks precomputed by
+    filter_range_mask.
+
+    Args:
+        iterable: Source iterable
+        mask: Booleans aligned with iterable (stops at the shorter of the two)
+
+    Returns:
+        Iterator of selected elements
+
+    Time Complexity: O(1) to create, O(n) to consume
+    Space Complexity: O(1)
+
+    Example:
+        >>> list(filter_by_mask(['a', 'b', 'c'], [True, False, True]))
+        ['a', 'c']
+    """
+    return compress(iterable, mask)
+
+
 def filter_range(
     iterable: Iterable[T],
     key: Callable[[T], NumericType],
@@ -104,16 +130,92 @@ def filter_range(
     return filter_by(iterable, predicate)
 
 
+def filter_range_mask(
+    values: Iterable[NumericType],
+    min_val: NumericType,
+    max_val: NumericType,
+    inclusive: bool = True,
+) -> list[bool]:
+    """
+    Build a boolean mask of values within numeric range.
+
+    Columnar counterpart of filter_range: operates on a flat column of
+    numbers (e.g. an array of cents) rather than calling a key function
+    per record. Apply the mask with itertools.compress.
+
+    Args:
+        values: Column of numeric values
+        min_val: Minimum value (inclusive or exclusive)
+        max_val: Maximum value (inclusive or exclusive)
+        inclusive: Whether bounds are inclusive
+
+    Returns:
+        List of booleans, True where the value is within range
+
+    Time Complexity: O(n)
+    Space Complexity: O(n)
+
+    Example:
+        >>> filter_range_mask([50, 150, 250], 100, 200)
+        [False, True, False]
+    """
+    if inclusive:
+        return [min_val <= value <= max_val for value in values]
+    return [min_val < value < max_val for value in values]
+
+
+def _parse_iso_date(date_str: str) -> date:
+    """
+    Parse a date in ISO_DATE_FORMAT, using date.fromisoformat when safe.
+
+    fromisoformat is only used for the strict YYYY-MM-DD shape: since
+    Python 3.11 it also accepts forms such as "20230115" and "2023-W03-1",
+    which "%Y-%m-%d" rejects. Anything else (e.g. non-zero-padded
+    "2023-1-5") goes through strptime.
+    """
+    if len(date_str) == 10 and date_str[4] == date_str[7] == "-":
+        return date.fromisoformat(date_str)
+    return datetime.strptime(date_str, ISO_DATE_FORMAT).date()
+
+
+def date_to_int(date_str: str) -> int:
+    """
+    Convert an ISO date string to a sortable YYYYMMDD integer.
+
+    Lets callers convert a date column once and filter repeatedly with
+    filter_range, comparing ints instead of parsing dates.
+
+    Args:
+        date_str: Date string in YYYY-MM-DD format
+
+    Returns:
+        Integer of the form YYYYMMDD
+
+    Raises:
+        ValueError: If date_str is not a valid date
+
+    Example:
+        >>> date_to_int('2023-06-20')
+        20230620
+    """
+    parsed = _parse_iso_date(date_str)
+    return parsed.year * 10000 + parsed.month * 100 + parsed.day
+
+
 def filter_date_range(
     iterable: Iterable[T],
     key: Callable[[T], str],
     start_date: str,
     end_date: str,
-    date_format: str = "%Y-%m-%d",
+    date_format: str = ISO_DATE_FORMAT,
 ) -> Iterable[T]:
     """
     Filter elements within date range.
 
+    ISO dates (the default format) are parsed with date.fromisoformat,
+    which is implemented in C and much faster than strptime; other
+    formats go through strptime.
+
     Args:
         iterable: Source iterable
         key: Function to extract date string
@@ -141,15 +243,24 @@ def filter_date_range(
         ... ))
         [{'date': '2023-01-15'}, {'date': '2023-06-20'}]
     """
-    start = datetime.strptime(start_date, date_format)
-    end = datetime.strptime(end_date, date_format)
+    if date_format == ISO_DATE_FORMAT:
+        start = _parse_iso_date(start_date)
+        end = _parse_iso_date(end_date)
 
-    def predicate(item: T) -> bool:
+        def predicate(item: T) -> bool:
+            return start <= _parse_iso_date(key(item)) <= end
+
+        return filter_by(iterable, predicate)
+
+    start_dt = datetime.strptime(start_date, date_format)
+    end_dt = datetime.strptime(end_date, date_format)
+
+    def predicate_strptime(item: T) -> bool:
         date_str = key(item)
-        date = datetime.strptime(date_str, date_format)
-        return start <= date <= end
+        parsed = datetime.strptime(date_str, date_format)
+        return start_dt <= parsed <= end_dt
 
-    return filter_by(iterable, predicate)
+    return filter_by(iterable, predicate_strptime)
 
 
 def filter_top_n(iterable: Iterable[T], key: Callable[[T], Any], n: int) -> list[T]:
@@ -174,8 +285,6 @@ def filter_top_n(iterable: Iterable[T], key: Callable[[T], Any], n: int) -> list
         >>> filter_top_n(transactions, lambda t: t['amount'], 2)
         [{'amount': 500}, {'amount': 200}]
     """
-    from heapq import nlargest
-
     return nlargest(n, iterable, key=key)
 
 
@@ -199,8 +308,6 @@ def filter_bottom_n(iterable: Iterable[T], key: Callable[[T], Any], n: int) -> l
         >>> filter_bottom_n(transactions, lambda t: t['amount'], 2)
         [{'amount': 100}, {'amount': 200}]
     """
-    from heapq import nsmallest
-
     return nsmallest(n, iterable, key=key)
 
 
@@ -235,7 +342,8 @@ def filter_empty_strings(iterable: Iterable[str]) -> Iterable[str]:
         >>> list(filter_empty_strings(['a', '', 'b', '', 'c']))
         ['a', 'b', 'c']
     """
-    return (item for item in iterable if item.strip())
+    # Whitespace-only strings strip to "" and are dropped too
+    return filter(str.strip, iterable)
 
 
 def filter_unique(
@@ -244,7 +352,8 @@ def filter_unique(
     """
     Filter to unique elements based on key function.
 
-    Preserves order of first occurrence.
+    Preserves order of first occurrence. Elements are yielded lazily, so
+    unbounded iterators are supported.
 
     Args:
         iterable: Source iterable
@@ -261,6 +370,11 @@ def filter_unique(
         >>> list(filter_unique(data, lambda x: x['id']))
         [{'id': 1, 'val': 'a'}, {'id': 2, 'val': 'b'}]
     """
+    if key is None and isinstance(iterable, (list, tuple)):
+        # Fast path for finite inputs: insertion-ordered dict keys dedupe in C
+        yield from dict.fromkeys(iterable)
+        return
+
     seen: set[Any] = set()
     for item in iterable:
         k = key(item) if key else item
@@ -288,7 +402,11 @@ def compose_filters(*predicates: Callable[[T], bool]) -> Callable[[T], bool]:
     """
 
     def combined(item: T) -> bool:
-        return all(predicate(item) for predicate in predicates)
+        # Plain loop short-circuits without a generator frame per call
+        for predicate in predicates:
+            if not predicate(item):
+                return False
+        return True
 
     return combined
 
@@ -312,7 +430,10 @@ def any_filter(*predicates: Callable[[T], bool]) -> Callable[[T], bool]:
     """
 
     def combined(item: T) -> bool:
-        return any(predicate(item) for predicate in predicates)
+        for predicate in predicates:
+            if predicate(item):
+                return True
+        return False
 
     return combined
 
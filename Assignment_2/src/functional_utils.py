@@ -12,7 +12,7 @@ These utilities enable elegant pipeline-style data processing.
 
 from collections.abc import Callable, Iterable
 from functools import reduce
-from typing import Any, TypeVar
+from typing import Any, TypeVar, cast
 
 T = TypeVar("T")
 U = TypeVar("U")
@@ -355,11 +355,9 @@ def pairwise(iterable: Iterable[T]) -> Iterable[tuple[T, T]]:
         >>> list(pairwise([1, 2, 3, 4, 5]))
         [(1, 2), (2, 3), (3, 4), (4, 5)]
     """
-    from itertools import tee
+    from itertools import pairwise as _pairwise
 
-    a, b = tee(iterable)
-    next(b, None)
-    return zip(a, b)
+    return _pairwise(iterable)
 
 
 def sliding_window(iterable: Iterable[T], size: int) -> Iterable[tuple[T, ...]]:
@@ -457,15 +455,16 @@ def accumulate_with(
         func: Binary function for accumulation
         initial: Initial accumulator value
 
-    Yields:
-        Intermediate accumulation results (including initial)
+    Returns:
+        Iterator of intermediate accumulation results (including initial)
 
     Example:
         >>> list(accumulate_with([1, 2, 3, 4], lambda acc, x: acc + x, 0))
         [0, 1, 3, 6, 10]
     """
-    accumulator = initial
-    yield accumulator
-    for item in iterable:
-        accumulator = func(accumulator, item)
-        yield accumulator
+    from itertools import accumulate, chain
+
+    # itertools.accumulate runs the scan loop in C. The seed is chained in
+    # front rather than passed as initial=, which treats None as "no seed";
+    # the cast only widens func's item type for the mixed U/T stream
+    return accumulate(chain((initial,), iterable), cast(Callable[[U, Any], U], func))
@@ -11,7 +11,7 @@ Demonstrates map operations and functional transformations.
 """
 
 from collections.abc import Callable, Iterable
-from typing import Any, TypeVar
+from typing import Any, TypeVar, cast
 
 T = TypeVar("T")
 U = TypeVar("U")
@@ -146,6 +146,7 @@ def add_computed_field(
         [{'price': 100, 'quantity': 2, 'total': 200},
          {'price': 50, 'quantity': 3, 'total': 150}]
     """
+    # copy() keeps the mapping type (e.g. OrderedDict); {**item} would not
     for item in iterable:
         new_item = item.copy()
         new_item[field_name] = compute_func(item)
@@ -238,11 +239,9 @@ def pairwise(iterable: Iterable[T]) -> Iterable[tuple[T, T]]:
         >>> list(pairwise([1, 2, 3, 4, 5]))
         [(1, 2), (2, 3), (3, 4), (4, 5)]
     """
-    from itertools import tee
+    from itertools import pairwise as _pairwise
 
-    a, b = tee(iterable)
-    next(b, None)
-    return zip(a, b)
+    return _pairwise(iterable)
 
 
 def sliding_window(iterable: Iterable[T], window_size: int) -> Iterable[tuple[T, ...]]:
@@ -289,6 +288,19 @@ def batch(iterable: Iterable[T], batch_size: int) -> Iterable[list[T]]:
         >>> list(batch([1, 2, 3, 4, 5, 6, 7], 3))
         [[1, 2, 3], [4, 5, 6], [7]]
     """
+    # Same contract for both paths as islice: negative sizes are rejected,
+    # a size of zero yields no batches
+    if batch_size < 0:
+        raise ValueError(f"batch_size must be non-negative, got {batch_size}")
+    if batch_size == 0:
+        return
+
+    if isinstance(iterable, list):
+        # Fast path: slicing copies each batch in one C call
+        for start in range(0, len(iterable), batch_size):
+            yield iterable[start : start + batch_size]
+        return
+
     from itertools import islice
 
     iterator = iter(iterable)
@@ -338,6 +350,8 @@ def accumulate_with(
         >>> list(accumulate_with([1, 2, 3, 4], lambda acc, x: acc + x, 0))
         [0, 1, 3, 6, 10]
     """
-    from itertools import accumulate
+    from itertools import accumulate, chain
 
-    return accumulate(iterable, func, initial=initial)
+    # Chained seed, since initial=None would mean "no seed" to accumulate;
+    # the cast only widens func's item type for the mixed U/T stream
+    return accumulate(chain((initial,), iterable), cast(Callable[[U, Any], U], func))
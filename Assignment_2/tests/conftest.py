@@ -4,12 +4,88 @@ Pytest Configuration and Fixtures.
 Provides common test fixtures for unit and integration tests.
 """
 
+import csv
+import os
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 from decimal import Decimal
+from functools import lru_cache
+from operator import itemgetter
+from pathlib import Path
+from typing import Any
 
 import pytest
 
+from src import analyses
+from src.batch import SalesBatch
 from src.data_loader import SalesTransaction
 
+# Small deterministic dataset generated per session for the CSV tests
+SYNTHETIC_ROWS = 1000
+SYNTHETIC_SEED = 42
+
+
+# Opt-in test groups: marker name -> command line option enabling it
+_OPT_IN_MARKERS = {"slow": "--run-slow", "perf": "--run-perf"}
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register command line options for opt-in test groups."""
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked as slow (CSV/data generator tests)",
+    )
+    parser.addoption(
+        "--run-perf",
+        action="store_true",
+        default=False,
+        help="run tests marked as perf (performance checks on large datasets)",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip tests in opt-in groups (slow, perf) unless their option is given."""
+    skips = {
+        marker: pytest.mark.skip(reason=f"need {option} option to run")
+        for marker, option in _OPT_IN_MARKERS.items()
+        if not config.getoption(option)
+    }
+    if not skips:
+        return
+
+    for item in items:
+        for marker, skip in skips.items():
+            if marker in item.keywords:
+                item.add_marker(skip)
+
+
+@dataclass(frozen=True)
+class CsvTable:
+    """
+    Raw CSV contents read once with csv.reader.
+
+    Rows are kept as tuples and indexed positionally through the header map,
+    avoiding the per-row dict that csv.DictReader builds.
+
+    Attributes:
+        header: Column names in file order
+        columns: Mapping of column name to positional index
+        rows: Data rows (header excluded)
+    """
+
+    header: tuple[str, ...]
+    columns: dict[str, int]
+    rows: list[tuple[str, ...]]
+
+    def column(self, name: str) -> Iterator[str]:
+        """Iterate over the values of a single column."""
+        return map(itemgetter(self.columns[name]), self.rows)
+
 
 @pytest.fixture
 def sample_transactions() -> list[SalesTransaction]:
@@ -179,33 +255,172 @@ def transactions_with_nulls() -> list[SalesTransaction]:
     ]
 
 
-@pytest.fixture
-def large_transaction_set() -> list[SalesTransaction]:
-    """Fixture providing larger set of transactions for performance testing."""
-    transactions = []
-    categories = ["Electronics", "Clothing", "Books", "Sports"]
-    regions = ["North", "South", "East", "West"]
-    segments = ["Individual", "SMB", "Enterprise"]
-
-    for i in range(100):
-        transactions.append(
-            SalesTransaction(
-                transaction_id=f"TXN-{i:07d}",
-                date=f"2023-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}",
-                timestamp=f"2023-{(i % 12) + 1:02d}-{(i % 28) + 1:02d} 12:00:00",
-                customer_id=f"CUST-{(i % 20):05d}",
-                product_id=f"PROD-{(i % 50):04d}",
-                product_category=categories[i % len(categories)],
-                product_name=f"Product {i}",
-                quantity=(i % 5) + 1,
-                unit_price=Decimal(str((i % 100) + 10)),
-                total_amount=Decimal(str(((i % 100) + 10) * ((i % 5) + 1))),
-                discount_percent=float((i % 10) * 5),
-                payment_method="Credit Card" if i % 2 == 0 else "Cash",
-                region=regions[i % len(regions)],
-                sales_rep_id=f"REP-{(i % 10):03d}",
-                customer_segment=segments[i % len(segments)],
-            )
+_LARGE_CATEGORIES = ("Electronics", "Clothing", "Books", "Sports")
+_LARGE_REGIONS = ("North", "South", "East", "West")
+_LARGE_SEGMENTS = ("Individual", "SMB", "Enterprise")
+
+
+def _large_rows(count: int) -> tuple[tuple, ...]:
+    """Build positional field tuples in SalesTransaction order for count rows."""
+    return tuple(
+        (
+            f"TXN-{i:07d}",
+            f"2023-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}",
+            f"2023-{(i % 12) + 1:02d}-{(i % 28) + 1:02d} 12:00:00",
+            f"CUST-{(i % 20):05d}",
+            f"PROD-{(i % 50):04d}",
+            _LARGE_CATEGORIES[i % len(_LARGE_CATEGORIES)],
+            f"Product {i}",
+            (i % 5) + 1,
+            # Exact ints convert directly; no str() round-trip needed
+            Decimal((i % 100) + 10),
+            Decimal(((i % 100) + 10) * ((i % 5) + 1)),
+            float((i % 10) * 5),
+            "Credit Card" if i % 2 == 0 else "Cash",
+            _LARGE_REGIONS[i % len(_LARGE_REGIONS)],
+            f"REP-{(i % 10):03d}",
+            _LARGE_SEGMENTS[i % len(_LARGE_SEGMENTS)],
         )
+        for i in range(count)
+    )
+
+
+# Built once at import for the shared 100-row fixtures
+_LARGE_ROWS = _large_rows(100)
+
+
+@pytest.fixture(scope="session")
+def large_transaction_set() -> list[SalesTransaction]:
+    """
+    Fixture providing larger set of transactions for performance testing.
+
+    Built once per session and shared by every test that requests it;
+    tests must not mutate the list.
+    """
+    return list(map(SalesTransaction._make, _LARGE_ROWS))
+
+
+@pytest.fixture(scope="session")
+def large_transaction_batch(
+    large_transaction_set: list[SalesTransaction],
+) -> SalesBatch:
+    """Fixture providing large_transaction_set in columnar form, built once."""
+    return SalesBatch.from_transactions(large_transaction_set)
+
+
+@lru_cache(maxsize=None)
+def _make_transactions(count: int) -> tuple[SalesTransaction, ...]:
+    """Build (once per count) a deterministic transaction set of count rows."""
+    return tuple(map(SalesTransaction._make, _large_rows(count)))
+
+
+@pytest.fixture(scope="session")
+def make_transactions() -> Callable[[int], list[SalesTransaction]]:
+    """
+    Fixture providing a factory for deterministic transaction sets by size.
+
+    Rows follow the same pattern as large_transaction_set; each size is
+    generated once per session and returned as a fresh list.
+    """
+    return lambda count: list(_make_transactions(count))
+
+
+@pytest.fixture(scope="session")
+def large_analysis_results(
+    large_transaction_set: list[SalesTransaction],
+) -> dict[str, Any]:
+    """
+    Fixture providing analyses.run_all over large_transaction_set, run once.
+
+    Integration tests check different properties of the same results, so
+    they share this single run. Results must be treated as read-only.
+    """
+    return analyses.run_all(large_transaction_set)
+
+
+def _write_synthetic_csv(target: Path) -> None:
+    """
+    Generate the synthetic dataset and atomically move it into place.
+
+    Writing to a per-process temp file and renaming with os.replace means
+    workers waiting in _generate_once never observe a partially written CSV.
+    """
+    from scripts.generate_sales_data import (
+        GeneratorConfig,
+        generate_dataset,
+        write_to_csv,
+    )
+
+    partial = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    config = GeneratorConfig(
+        num_rows=SYNTHETIC_ROWS, seed=SYNTHETIC_SEED, output_path=str(partial)
+    )
+    write_to_csv(generate_dataset(config), config.output_path)
+    os.replace(partial, target)
+
+
+def _generate_once(target: Path, timeout: float = 120.0) -> None:
+    """
+    Generate the synthetic CSV in exactly one process.
+
+    Creating the lock file with O_CREAT | O_EXCL is atomic, so only the
+    first xdist worker to get there generates the dataset; the others poll
+    until the finished CSV appears. The lock is removed only if generation
+    fails, letting a waiting worker retry instead of timing out.
+    """
+    lock = target.with_name(f"{target.name}.lock")
+    try:
+        fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        deadline = time.monotonic() + timeout
+        while not target.exists():
+            if not lock.exists():
+                # The generating worker failed; take over
+                return _generate_once(target, timeout)
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Timed out waiting for {target} ({lock} held)")
+            time.sleep(0.05)
+        return
+
+    try:
+        _write_synthetic_csv(target)
+    except BaseException:
+        lock.unlink()
+        raise
+    finally:
+        os.close(fd)
+
+
+@pytest.fixture(scope="session")
+def sales_csv(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Fixture providing a synthetic sales CSV generated once per session.
+
+    Uses the data generator with a fixed seed so tests are deterministic
+    and do not depend on data/sales_data.csv having been generated. Under
+    pytest-xdist the file lives in the temp root shared by all workers, so
+    it is generated once rather than once per worker.
+    """
+    if os.environ.get("PYTEST_XDIST_WORKER") is None:
+        output_path = tmp_path_factory.mktemp("data") / "sales_data.csv"
+    else:
+        output_path = tmp_path_factory.getbasetemp().parent / "sales_data.csv"
+
+    if not output_path.exists():
+        _generate_once(output_path)
+    return output_path
+
+
+@pytest.fixture(scope="session")
+def sales_csv_table(sales_csv: Path) -> CsvTable:
+    """Fixture providing the synthetic sales CSV, parsed once per session."""
+    with sales_csv.open("r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = tuple(next(reader))
+        rows = [tuple(row) for row in reader]
 
-    return transactions
+    return CsvTable(
+        header=header,
+        columns={name: index for index, name in enumerate(header)},
+        rows=rows,
+    )
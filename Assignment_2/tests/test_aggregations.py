@@ -21,18 +21,26 @@ from src.aggregations import (
     variance_by,
 )
 
+# Expected values, built once rather than re-parsed in every test
+D0, D1, D24, D50, D95, D150, D175, D350 = map(
+    Decimal, ("0", "1", "24", "50", "95", "150", "175", "350")
+)
+AVG_TOLERANCE = Decimal("0.0000000000000000000000001")
+
+# Shared input: sums to 350
+AMOUNTS_3 = ({"amount": 100}, {"amount": 200}, {"amount": 50})
+
 
 def test_sum_by() -> None:
     """Test summing by key function."""
-    data = [{"amount": 100}, {"amount": 200}, {"amount": 50}]
-    result = sum_by(data, lambda d: d["amount"])
-    assert result == Decimal("350")
+    result = sum_by(AMOUNTS_3, lambda d: d["amount"])
+    assert result == D350
 
 
 def test_sum_by_empty() -> None:
     """Test sum of empty iterable."""
     result = sum_by([], lambda d: d["amount"])
-    assert result == Decimal("0")
+    assert result == D0
 
 
 def test_count_by_no_predicate() -> None:
@@ -49,10 +57,9 @@ def test_count_by_with_predicate() -> None:
 
 def test_avg_by() -> None:
     """Test averaging by key function."""
-    data = [{"amount": 100}, {"amount": 200}, {"amount": 50}]
-    result = avg_by(data, lambda d: d["amount"])
-    expected = Decimal("350") / Decimal("3")
-    assert abs(result - expected) < Decimal("0.0000000000000000000000001")
+    result = avg_by(AMOUNTS_3, lambda d: d["amount"])
+    expected = D350 / Decimal(3)
+    assert abs(result - expected) < AVG_TOLERANCE
 
 
 def test_avg_by_empty() -> None:
@@ -91,14 +98,14 @@ def test_median_by_odd_count() -> None:
     """Test median with odd number of elements."""
     data = [{"amount": 100}, {"amount": 200}, {"amount": 150}]
     result = median_by(data, lambda d: d["amount"])
-    assert result == Decimal("150")
+    assert result == D150
 
 
 def test_median_by_even_count() -> None:
     """Test median with even number of elements."""
     data = [{"amount": 100}, {"amount": 200}, {"amount": 150}, {"amount": 250}]
     result = median_by(data, lambda d: d["amount"])
-    assert result == Decimal("175")  # (150 + 200) / 2
+    assert result == D175  # (150 + 200) / 2
 
 
 def test_median_by_empty() -> None:
@@ -111,10 +118,10 @@ def test_percentile_by() -> None:
     """Test percentile calculation."""
     data = [{"amount": i} for i in range(101)]
     result = percentile_by(data, lambda d: d["amount"], 50.0)
-    assert result == Decimal("50")
+    assert result == D50
 
     result_95 = percentile_by(data, lambda d: d["amount"], 95.0)
-    assert result_95 == Decimal("95")
+    assert result_95 == D95
 
 
 def test_percentile_by_invalid_range() -> None:
@@ -162,17 +169,17 @@ def test_product_by() -> None:
     """Test product calculation."""
     data = [{"val": 2}, {"val": 3}, {"val": 4}]
     result = product_by(data, lambda d: d["val"])
-    assert result == Decimal("24")
+    assert result == D24
 
 
 def test_product_by_with_zero() -> None:
     """Test product with zero."""
     data = [{"val": 2}, {"val": 0}, {"val": 4}]
     result = product_by(data, lambda d: d["val"])
-    assert result == Decimal("0")
+    assert result == D0
 
 
 def test_product_by_empty() -> None:
     """Test product of empty iterable returns 1."""
     result = product_by([], lambda d: d["val"])
-    assert result == Decimal("1")
+    assert result == D1
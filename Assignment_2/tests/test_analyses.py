@@ -4,9 +4,18 @@ Unit Tests for Analysis Functions.
 Tests all 14 analysis functions with sample data.
 """
 
+import math
 from decimal import Decimal
 
+import pytest
+
 from src import analyses
+from src.batch import filter_mask
+
+
+def _is_desc(values):
+    """Check non-increasing order in a single O(n) pass."""
+    return all(a >= b for a, b in zip(values, values[1:]))
 
 
 def test_analysis_01_revenue_by_category(sample_transactions):
@@ -20,23 +29,27 @@ def test_analysis_01_revenue_by_category(sample_transactions):
 
     # Check that revenues are sorted descending
     revenues = [r[1] for r in result]
-    assert revenues == sorted(revenues, reverse=True)
+    assert _is_desc(revenues)
 
     # Electronics should have highest revenue (199.98 + 47.97 = 247.95)
     assert result[0][0] == "Electronics"
     assert result[0][1] == Decimal("247.95")
 
 
-def test_analysis_02_top_products_by_volume(sample_transactions):
+@pytest.mark.parametrize("top_n", [1, 5])
+def test_analysis_02_top_products_by_volume(sample_transactions, top_n):
     """Test top products by volume analysis."""
-    result = analyses.analysis_02_top_products_by_volume(sample_transactions, top_n=5)
+    result = analyses.analysis_02_top_products_by_volume(
+        sample_transactions, top_n=top_n
+    )
 
+    assert len(result) <= top_n
     assert len(result) > 0
     assert all(isinstance(item, tuple) and len(item) == 3 for item in result)
 
     # Check that quantities are sorted descending
     quantities = [r[2] for r in result]
-    assert quantities == sorted(quantities, reverse=True)
+    assert _is_desc(quantities)
 
 
 def test_analysis_03_avg_transaction_by_segment(sample_transactions):
@@ -97,10 +110,26 @@ def test_analysis_06_discount_impact(sample_transactions):
     )
 
 
-def test_analysis_07_sales_rep_performance(sample_transactions):
+def test_analysis_06_matches_batch_mask(large_transaction_set, large_transaction_batch):
+    """Test discount counts match a mask count over the batch discount column."""
+    result = analyses.analysis_06_discount_impact(large_transaction_set)
+
+    undiscounted = filter_mask(large_transaction_batch, "discount_percent", 0, 0)
+    non_discounted_count = undiscounted.count(True)
+
+    assert result["non_discounted_count"] == non_discounted_count
+    assert result["discounted_count"] == len(undiscounted) - non_discounted_count
+    assert 0 < non_discounted_count < len(undiscounted)
+
+
+@pytest.mark.parametrize("top_n", [1, 5])
+def test_analysis_07_sales_rep_performance(sample_transactions, top_n):
     """Test sales rep performance analysis."""
-    result = analyses.analysis_07_sales_rep_performance(sample_transactions, top_n=5)
+    result = analyses.analysis_07_sales_rep_performance(
+        sample_transactions, top_n=top_n
+    )
 
+    assert len(result) <= top_n
     assert isinstance(result, list)
     assert len(result) > 0
 
@@ -139,10 +168,11 @@ def test_analysis_09_seasonal_pattern(sample_transactions):
             assert isinstance(revenue, Decimal)
 
 
-def test_analysis_10_high_value_transactions(sample_transactions):
+@pytest.mark.parametrize("percentile", [50.0, 95.0])
+def test_analysis_10_high_value_transactions(sample_transactions, percentile):
     """Test high-value transactions analysis."""
     result = analyses.analysis_10_high_value_transactions(
-        sample_transactions, percentile=95.0
+        sample_transactions, percentile=percentile
     )
 
     assert isinstance(result, dict)
@@ -160,14 +190,18 @@ def test_analysis_11_category_mix_by_region(sample_transactions):
     for region, categories in result.items():
         assert isinstance(categories, dict)
         # Percentages should sum to approximately 100
-        total_percentage = sum(categories.values())
+        total_percentage = math.fsum(categories.values())
         assert 99.0 <= total_percentage <= 101.0  # Allow for rounding
 
 
-def test_analysis_12_customer_lifetime_value(sample_transactions):
+@pytest.mark.parametrize("top_n", [1, 5])
+def test_analysis_12_customer_lifetime_value(sample_transactions, top_n):
     """Test customer lifetime value analysis."""
-    result = analyses.analysis_12_customer_lifetime_value(sample_transactions, top_n=5)
+    result = analyses.analysis_12_customer_lifetime_value(
+        sample_transactions, top_n=top_n
+    )
 
+    assert len(result) <= top_n
     assert isinstance(result, list)
 
     for customer_id, metrics in result:
@@ -226,3 +260,27 @@ def test_single_transaction(single_transaction):
 
     result_03 = analyses.analysis_03_avg_transaction_by_segment(single_transaction)
     assert len(result_03) == 1
+
+
+def test_run_all_matches_individual_analyses(sample_transactions):
+    """Test run_all returns each analysis result under its number."""
+    results = analyses.run_all(iter(sample_transactions))
+
+    assert list(results) == [f"{n:02d}" for n in range(1, 15)]
+    assert results["01"] == analyses.analysis_01_revenue_by_category(
+        sample_transactions
+    )
+    assert results["04"] == analyses.analysis_04_monthly_sales_trend(
+        sample_transactions
+    )
+    assert results["09"] == analyses.analysis_09_seasonal_pattern(sample_transactions)
+
+
+def test_date_analyses_reject_invalid_dates(single_transaction):
+    """Test memoized date keys still raise on malformed dates."""
+    bad = [single_transaction[0]._replace(date="2023-13-01")]
+
+    with pytest.raises(ValueError):
+        analyses.analysis_04_monthly_sales_trend(bad)
+    with pytest.raises(ValueError):
+        analyses.analysis_09_seasonal_pattern(bad)
@@ -0,0 +1,163 @@
+"""
+Unit Tests for Columnar Batch Module.
+
+Tests batch construction, cents conversion, and mask-based filtering.
+"""
+
+import dataclasses
+import tempfile
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from src.batch import (
+    SalesBatch,
+    apply_mask,
+    filter_date_mask,
+    filter_mask,
+    from_cents,
+    to_cents,
+    validate_batch,
+)
+from src.data_loader import load_csv_as_list, load_csv_columns, validate_transaction
+
+
+def test_to_cents_and_back() -> None:
+    """Test Decimal/cents conversion round-trips exactly."""
+    assert to_cents(Decimal("19.99")) == 1999
+    assert to_cents(Decimal("25")) == 2500
+    assert from_cents(1999) == Decimal("19.99")
+
+    with pytest.raises(ValueError, match="whole cents"):
+        to_cents(Decimal("0.005"))
+
+
+def test_from_transactions_round_trip(sample_transactions) -> None:
+    """Test batch columns match the source rows and convert back."""
+    batch = SalesBatch.from_transactions(sample_transactions)
+
+    assert len(batch) == len(sample_transactions)
+    assert batch.transaction_id == tuple(t.transaction_id for t in sample_transactions)
+    assert batch.total_amount_cents.tolist() == [
+        to_cents(t.total_amount) for t in sample_transactions
+    ]
+    assert list(batch.transactions()) == sample_transactions
+
+
+def test_from_transactions_empty() -> None:
+    """Test building a batch from no rows."""
+    batch = SalesBatch.from_transactions([])
+
+    assert len(batch) == 0
+    assert batch.transaction_id == ()
+    assert batch.quantity.tolist() == []
+    assert list(batch.transactions()) == []
+
+
+def test_from_columns_matches_row_loader() -> None:
+    """Test columnar CSV load gives the same records as load_csv."""
+    csv_content = """transaction_id,date,timestamp,customer_id,product_id,product_category,product_name,quantity,unit_price,total_amount,discount_percent,payment_method,region,sales_rep_id,customer_segment
+TXN-0000001,2023-01-01,2023-01-01 12:00:00,CUST-00001,PROD-0001,Electronics,Laptop,2,999.99,1999.98,0.0,Credit Card,North,REP-001,Enterprise
+TXN-0000002,2023-01-02,2023-01-02 13:00:00,,PROD-0002,Books,Novel,1,25.00,22.50,10.0,Cash,South,,Individual
+"""
+
+    with tempfile.NamedTemporaryFile(
+        mode="w", suffix=".csv", delete=False, encoding="utf-8"
+    ) as f:
+        f.write(csv_content)
+        temp_path = f.name
+
+    try:
+        batch = SalesBatch.from_columns(load_csv_columns(temp_path))
+        rows = load_csv_as_list(temp_path)
+    finally:
+        Path(temp_path).unlink()
+
+    assert batch.unit_price_cents.tolist() == [99999, 2500]
+    assert batch.customer_id == ("CUST-00001", None)
+    assert list(batch.transactions()) == rows
+
+
+def test_from_columns_missing_column() -> None:
+    """Test building a batch without a required column raises ValueError."""
+    with pytest.raises(ValueError, match="Missing required column"):
+        SalesBatch.from_columns({"transaction_id": ("TXN-0000001",)})
+
+
+def test_batch_rejects_ragged_columns(sample_transactions) -> None:
+    """Test columns of different lengths raise instead of truncating rows."""
+    batch = SalesBatch.from_transactions(sample_transactions)
+
+    with pytest.raises(ValueError, match="different lengths"):
+        dataclasses.replace(batch, date=batch.date[:1])
+
+
+def test_batch_equality_without_hash(sample_transactions) -> None:
+    """Test batches compare by value but are explicitly unhashable."""
+    first = SalesBatch.from_transactions(sample_transactions)
+    second = SalesBatch.from_transactions(sample_transactions)
+
+    assert first == second
+    with pytest.raises(TypeError, match="unhashable"):
+        hash(first)
+
+
+def test_filter_mask_inclusive(large_transaction_set, large_transaction_batch) -> None:
+    """Test columnar range filtering matches row-wise filtering."""
+    batch = large_transaction_batch
+
+    mask = filter_mask(batch, "total_amount_cents", 10_000, 20_000)
+    selected = apply_mask(batch, mask)
+
+    expected = [
+        t
+        for t in large_transaction_set
+        if Decimal(100) <= t.total_amount <= Decimal(200)
+    ]
+    assert len(selected) == len(expected) > 0
+    assert list(selected.transactions()) == expected
+    assert selected.quantity.typecode == "q"
+
+
+def test_filter_date_mask(large_transaction_set, large_transaction_batch) -> None:
+    """Test integer date masks match string date comparison."""
+    batch = large_transaction_batch
+
+    assert batch.date_key[0] == 20230101
+
+    selected = apply_mask(batch, filter_date_mask(batch, "2023-03-01", "2023-06-30"))
+
+    expected = [
+        t for t in large_transaction_set if "2023-03-01" <= t.date <= "2023-06-30"
+    ]
+    assert len(selected) == len(expected) > 0
+    assert list(selected.transactions()) == expected
+
+
+def test_filter_mask_invalid() -> None:
+    """Test unknown columns and mismatched masks raise ValueError."""
+    batch = SalesBatch.from_transactions([])
+
+    with pytest.raises(ValueError, match="Unknown column"):
+        filter_mask(batch, "total_amount", 0, 1)
+
+    with pytest.raises(ValueError, match="not numeric"):
+        filter_mask(batch, "region", 0, 1)
+
+    with pytest.raises(ValueError, match="Mask has"):
+        apply_mask(batch, [True])
+
+
+def test_validate_batch_mixed(single_transaction) -> None:
+    """Test batch validation flags the same rows as validate_transaction."""
+    valid = single_transaction[0]
+    rows = [
+        valid._replace(quantity=0),
+        valid._replace(discount_percent=150.0),
+        valid,
+    ]
+    batch = SalesBatch.from_transactions(rows)
+
+    assert validate_batch(batch) == [False, False, True]
+    assert validate_batch(batch) == list(map(validate_transaction, rows))
@@ -4,32 +4,28 @@ Unit Tests for Sales Data Generator.
 Tests dataset generation logic, validation, and reproducibility.
 """
 
-import csv
-import tempfile
-from datetime import datetime
+import re
 from decimal import Decimal
 from pathlib import Path
 
 import pytest
 
+from tests.conftest import CsvTable
 
-def test_generated_data_file_exists() -> None:
-    """Test that generated data file exists."""
-    data_file = Path("data/sales_data.csv")
-    assert data_file.exists(), "Sales data file should exist"
+# Generates and parses a CSV dataset; run with --run-slow
+pytestmark = pytest.mark.slow
 
+# YYYY-MM-DD with a plausible month/day; the year range is checked separately
+_DATE_RE = re.compile(r"^(20\d\d)-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$")
 
-def test_generated_data_has_correct_schema() -> None:
-    """Test that generated data has all required columns."""
-    data_file = Path("data/sales_data.csv")
 
-    if not data_file.exists():
-        pytest.skip("Data file not generated yet")
+def test_generated_data_file_exists(sales_csv: Path) -> None:
+    """Test that generated data file exists."""
+    assert sales_csv.exists(), "Sales data file should exist"
 
-    with open(data_file, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        headers = reader.fieldnames
 
+def test_generated_data_has_correct_schema(sales_csv_table: CsvTable) -> None:
+    """Test that generated data has all required columns."""
     expected_columns = {
         "transaction_id",
         "date",
@@ -48,144 +44,90 @@ def test_generated_data_has_correct_schema() -> None:
         "customer_segment",
     }
 
-    assert headers is not None
-    assert set(headers) == expected_columns
+    assert set(sales_csv_table.header) == expected_columns
 
 
-def test_generated_data_has_valid_rows() -> None:
+def test_generated_data_has_valid_rows(sales_csv_table: CsvTable) -> None:
     """Test that generated data has reasonable number of rows."""
-    data_file = Path("data/sales_data.csv")
-
-    if not data_file.exists():
-        pytest.skip("Data file not generated yet")
-
-    with open(data_file, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        row_count = sum(1 for _ in reader)
+    row_count = len(sales_csv_table.rows)
 
     # Should have at least 1000 rows (reasonable minimum)
     assert row_count >= 1000, f"Expected at least 1000 rows, got {row_count}"
 
 
-def test_generated_data_has_unique_transaction_ids() -> None:
+def test_generated_data_has_unique_transaction_ids(sales_csv_table: CsvTable) -> None:
     """Test that all transaction IDs are unique."""
-    data_file = Path("data/sales_data.csv")
+    # Stream into a single set and stop at the first collision
+    seen: set[str] = set()
+    for transaction_id in sales_csv_table.column("transaction_id"):
+        if transaction_id in seen:
+            pytest.fail(f"Duplicate transaction ID: {transaction_id}")
+        seen.add(transaction_id)
 
-    if not data_file.exists():
-        pytest.skip("Data file not generated yet")
 
-    transaction_ids = []
-    with open(data_file, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            transaction_ids.append(row["transaction_id"])
+def test_generated_data_valid_dates(sales_csv_table: CsvTable) -> None:
+    """Test that dates are valid and within expected range."""
+    date_index = sales_csv_table.columns["date"]
 
-    # Check uniqueness
-    assert len(transaction_ids) == len(
-        set(transaction_ids)
-    ), "Transaction IDs should be unique"
+    # Verify date format (sample first 100 rows)
+    for row in sales_csv_table.rows[:100]:
+        date_str = row[date_index]
+        match = _DATE_RE.match(date_str)
+        assert match, f"Invalid date format: {date_str}"
+        # Verify reasonable range (2020-2025)
+        assert 2020 <= int(match.group(1)) <= 2025, date_str
 
 
-def test_generated_data_valid_dates() -> None:
-    """Test that dates are valid and within expected range."""
-    data_file = Path("data/sales_data.csv")
-
-    if not data_file.exists():
-        pytest.skip("Data file not generated yet")
-
-    dates = []
-    with open(data_file, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for i, row in enumerate(reader):
-            if i >= 100:  # Sample first 100 rows
-                break
-            dates.append(row["date"])
-
-    # Verify date format
-    for date_str in dates:
-        try:
-            parsed_date = datetime.strptime(date_str, "%Y-%m-%d")
-            # Verify reasonable range (2020-2025)
-            assert 2020 <= parsed_date.year <= 2025
-        except ValueError:
-            pytest.fail(f"Invalid date format: {date_str}")
-
-
-def test_generated_data_valid_numeric_fields() -> None:
+def test_generated_data_valid_numeric_fields(sales_csv_table: CsvTable) -> None:
     """Test that numeric fields have valid values."""
-    data_file = Path("data/sales_data.csv")
-
-    if not data_file.exists():
-        pytest.skip("Data file not generated yet")
-
-    with open(data_file, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for i, row in enumerate(reader):
-            if i >= 100:  # Sample first 100 rows
-                break
+    columns = sales_csv_table.columns
 
-            # Test quantity is positive integer
-            quantity = int(row["quantity"])
-            assert quantity > 0, f"Quantity should be positive, got {quantity}"
+    for row in sales_csv_table.rows[:100]:  # Sample first 100 rows
+        # Test quantity is positive integer
+        quantity = int(row[columns["quantity"]])
+        assert quantity > 0, f"Quantity should be positive, got {quantity}"
 
-            # Test unit_price is positive
-            unit_price = Decimal(row["unit_price"])
-            assert unit_price > 0, f"Unit price should be positive, got {unit_price}"
+        # Test unit_price is positive
+        unit_price = Decimal(row[columns["unit_price"]])
+        assert unit_price > 0, f"Unit price should be positive, got {unit_price}"
 
-            # Test total_amount is positive
-            total_amount = Decimal(row["total_amount"])
-            assert (
-                total_amount >= 0
-            ), f"Total amount should be non-negative, got {total_amount}"
+        # Test total_amount is positive
+        total_amount = Decimal(row[columns["total_amount"]])
+        assert (
+            total_amount >= 0
+        ), f"Total amount should be non-negative, got {total_amount}"
 
-            # Test discount_percent is in valid range
-            discount = Decimal(row["discount_percent"])
-            assert 0 <= discount <= 100, f"Discount should be 0-100%, got {discount}"
+        # Test discount_percent is in valid range
+        discount = Decimal(row[columns["discount_percent"]])
+        assert 0 <= discount <= 100, f"Discount should be 0-100%, got {discount}"
 
 
-def test_generated_data_business_logic() -> None:
+def test_generated_data_business_logic(sales_csv_table: CsvTable) -> None:
     """Test that business logic is correct (total = quantity * unit_price * (1 - discount))."""
-    data_file = Path("data/sales_data.csv")
+    columns = sales_csv_table.columns
 
-    if not data_file.exists():
-        pytest.skip("Data file not generated yet")
+    for row in sales_csv_table.rows[:100]:  # Sample first 100 rows
+        quantity = Decimal(row[columns["quantity"]])
+        unit_price = Decimal(row[columns["unit_price"]])
+        discount_percent = Decimal(row[columns["discount_percent"]])
+        total_amount = Decimal(row[columns["total_amount"]])
 
-    with open(data_file, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for i, row in enumerate(reader):
-            if i >= 100:  # Sample first 100 rows
-                break
+        # Calculate expected total
+        expected_total = quantity * unit_price * (1 - discount_percent / 100)
 
-            quantity = Decimal(row["quantity"])
-            unit_price = Decimal(row["unit_price"])
-            discount_percent = Decimal(row["discount_percent"])
-            total_amount = Decimal(row["total_amount"])
+        # Allow small rounding difference
+        difference = abs(total_amount - expected_total)
+        assert difference < Decimal("0.01"), (
+            f"Total amount calculation incorrect: "
+            f"{total_amount} != {expected_total} "
+            f"(diff: {difference})"
+        )
 
-            # Calculate expected total
-            expected_total = quantity * unit_price * (1 - discount_percent / 100)
 
-            # Allow small rounding difference
-            difference = abs(total_amount - expected_total)
-            assert difference < Decimal("0.01"), (
-                f"Total amount calculation incorrect: "
-                f"{total_amount} != {expected_total} "
-                f"(diff: {difference})"
-            )
-
-
-def test_generated_data_has_required_categories() -> None:
+def test_generated_data_has_required_categories(sales_csv_table: CsvTable) -> None:
     """Test that data includes expected categories."""
-    data_file = Path("data/sales_data.csv")
-
-    if not data_file.exists():
-        pytest.skip("Data file not generated yet")
-
-    categories = set()
-    with open(data_file, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row["product_category"]:  # Skip empty values
-                categories.add(row["product_category"])
+    # Skip empty values
+    categories = set(sales_csv_table.column("product_category")) - {""}
 
     # Should have multiple categories
     assert (
@@ -193,37 +135,21 @@ def test_generated_data_has_required_categories() -> None:
     ), f"Expected at least 3 categories, got {len(categories)}"
 
 
-def test_generated_data_has_required_regions() -> None:
+def test_generated_data_has_required_regions(sales_csv_table: CsvTable) -> None:
     """Test that data includes expected regions."""
-    data_file = Path("data/sales_data.csv")
-
-    if not data_file.exists():
-        pytest.skip("Data file not generated yet")
-
-    regions = set()
-    with open(data_file, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row["region"]:  # Skip empty values
-                regions.add(row["region"])
+    # Skip empty values
+    regions = set(sales_csv_table.column("region")) - {""}
 
     # Should have multiple regions
     assert len(regions) >= 2, f"Expected at least 2 regions, got {len(regions)}"
 
 
-def test_generated_data_has_required_payment_methods() -> None:
+def test_generated_data_has_required_payment_methods(
+    sales_csv_table: CsvTable,
+) -> None:
     """Test that data includes expected payment methods."""
-    data_file = Path("data/sales_data.csv")
-
-    if not data_file.exists():
-        pytest.skip("Data file not generated yet")
-
-    payment_methods = set()
-    with open(data_file, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row["payment_method"]:  # Skip empty values
-                payment_methods.add(row["payment_method"])
+    # Skip empty values
+    payment_methods = set(sales_csv_table.column("payment_method")) - {""}
 
     # Should have multiple payment methods
     assert (
@@ -231,23 +157,11 @@ def test_generated_data_has_required_payment_methods() -> None:
     ), f"Expected at least 2 payment methods, got {len(payment_methods)}"
 
 
-def test_data_generator_consistency() -> None:
+def test_data_generator_consistency(sales_csv_table: CsvTable) -> None:
     """Test that data generated is internally consistent."""
-    data_file = Path("data/sales_data.csv")
-
-    if not data_file.exists():
-        pytest.skip("Data file not generated yet")
-
     # Count customers and transactions
-    customers = set()
-    transaction_count = 0
-
-    with open(data_file, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row["customer_id"]:
-                customers.add(row["customer_id"])
-            transaction_count += 1
+    customers = set(sales_csv_table.column("customer_id")) - {""}
+    transaction_count = len(sales_csv_table.rows)
 
     # Should have multiple customers
     assert (
@@ -11,10 +11,15 @@ from pathlib import Path
 import pytest
 
 from src.data_loader import (
+    COLUMNS,
     SalesTransaction,
     load_csv,
     load_csv_as_list,
+    load_csv_columns,
+    make_extractor,
+    parse_cents,
     parse_decimal,
+    parse_fields,
     parse_float,
     parse_int,
     parse_optional_string,
@@ -36,6 +41,23 @@ def test_parse_decimal_invalid() -> None:
         parse_decimal("not a number")
 
 
+def test_parse_cents_valid() -> None:
+    """Test parsing money strings to integer cents."""
+    assert parse_cents("123.45") == 12345
+    assert parse_cents("0.99") == 99
+    assert parse_cents("19.9") == 1990
+    assert parse_cents("1000") == 100000
+    assert parse_cents("-5.25") == -525
+    assert parse_cents(".5") == 50
+
+
+def test_parse_cents_invalid() -> None:
+    """Test parsing invalid or over-precise money strings raises ValueError."""
+    for value in ("not a number", "", "-", ".", "1.234", "1.2.3", "--1"):
+        with pytest.raises(ValueError, match="Cannot parse"):
+            parse_cents(value)
+
+
 def test_parse_int_valid() -> None:
     """Test parsing valid integer strings."""
     assert parse_int("42") == 42
@@ -100,6 +122,85 @@ def test_parse_row_valid() -> None:
     assert transaction.discount_percent == 0.0
 
 
+def test_parse_fields_valid() -> None:
+    """Test parsing valid positional row through a header extractor."""
+    header = (
+        "transaction_id",
+        "date",
+        "timestamp",
+        "customer_id",
+        "product_id",
+        "product_category",
+        "product_name",
+        "quantity",
+        "unit_price",
+        "total_amount",
+        "discount_percent",
+        "payment_method",
+        "region",
+        "sales_rep_id",
+        "customer_segment",
+    )
+    row = (
+        "TXN-0000001",
+        "2023-01-01",
+        "2023-01-01 12:00:00",
+        "",
+        "PROD-0001",
+        "Electronics",
+        "Laptop",
+        "2",
+        "999.99",
+        "1999.98",
+        "0.0",
+        "Credit Card",
+        "North",
+        "REP-001",
+        "Enterprise",
+    )
+    extract = make_extractor({name: index for index, name in enumerate(header)})
+
+    transaction = parse_fields(extract(row))
+
+    assert transaction.transaction_id == "TXN-0000001"
+    assert transaction.customer_id is None
+    assert transaction.quantity == 2
+    assert transaction.unit_price == Decimal("999.99")
+    assert transaction.total_amount == Decimal("1999.98")
+    assert transaction.sales_rep_id == "REP-001"
+
+    # Short rows fail in the extractor; load_csv reports and skips them
+    with pytest.raises(IndexError):
+        extract(row[:5])
+
+    # Categorical fields are interned: equal values share one object
+    first, second = (
+        parse_fields(extract(tuple("".join(list(field)) for field in row)))
+        for _ in range(2)
+    )
+    assert first.region is second.region
+    assert first.product_category is second.product_category
+
+
+def test_make_extractor() -> None:
+    """Test extractor validates the header once and reorders fields."""
+    header = tuple(reversed(COLUMNS))
+    columns = {name: index for index, name in enumerate(header)}
+    extract = make_extractor(columns)
+
+    assert extract(header) == COLUMNS
+
+    # Optional columns may be absent from the header
+    required = [name for name in COLUMNS if name not in ("customer_id", "sales_rep_id")]
+    fields = make_extractor({name: i for i, name in enumerate(required)})(required)
+    assert fields[COLUMNS.index("customer_id")] == ""
+    assert fields[COLUMNS.index("quantity")] == "quantity"
+
+    del columns["quantity"]
+    with pytest.raises(ValueError, match="Missing required column: quantity"):
+        make_extractor(columns)
+
+
 def test_parse_row_with_empty_customer() -> None:
     """Test parsing row with empty customer_id."""
     row = {
@@ -262,6 +363,50 @@ TXN-0000002,2023-01-02,2023-01-02 13:00:00,CUST-00002,PROD-0002,Books,Novel,1,25
         Path(temp_path).unlink()
 
 
+def test_load_csv_columns() -> None:
+    """Test loading CSV column-wise as tuples of raw strings."""
+    csv_content = """transaction_id,quantity,unit_price
+TXN-0000001,2,999.99
+
+TXN-0000002,1,25.00
+"""
+
+    with tempfile.NamedTemporaryFile(
+        mode="w", suffix=".csv", delete=False, encoding="utf-8"
+    ) as f:
+        f.write(csv_content)
+        temp_path = f.name
+
+    try:
+        columns = load_csv_columns(temp_path)
+
+        assert list(columns) == ["transaction_id", "quantity", "unit_price"]
+        assert columns["transaction_id"] == ("TXN-0000001", "TXN-0000002")
+        assert columns["quantity"] == ("2", "1")
+        assert list(map(parse_cents, columns["unit_price"])) == [99999, 2500]
+    finally:
+        Path(temp_path).unlink()
+
+
+def test_load_csv_missing_column() -> None:
+    """Test loading CSV whose header lacks a required column fails fast."""
+    csv_content = """transaction_id,date
+TXN-0000001,2023-01-01
+"""
+
+    with tempfile.NamedTemporaryFile(
+        mode="w", suffix=".csv", delete=False, encoding="utf-8"
+    ) as f:
+        f.write(csv_content)
+        temp_path = f.name
+
+    try:
+        with pytest.raises(ValueError, match="Missing required column"):
+            load_csv_as_list(temp_path)
+    finally:
+        Path(temp_path).unlink()
+
+
 def test_load_csv_empty_file() -> None:
     """Test loading CSV with only header."""
     csv_content = """transaction_id,date,timestamp,customer_id,product_id,product_category,product_name,quantity,unit_price,total_amount,discount_percent,payment_method,region,sales_rep_id,customer_segment
@@ -281,7 +426,7 @@ def test_load_csv_empty_file() -> None:
 
 
 def test_sales_transaction_immutable() -> None:
-    """Test that SalesTransaction is immutable (frozen dataclass)."""
+    """Test that SalesTransaction is immutable (NamedTuple)."""
     transaction = SalesTransaction(
         transaction_id="TXN-0000001",
         date="2023-01-01",
@@ -301,5 +446,5 @@ def test_sales_transaction_immutable() -> None:
     )
 
     # Attempting to modify should raise exception
-    with pytest.raises(Exception):  # FrozenInstanceError or AttributeError
+    with pytest.raises(AttributeError):
         transaction.quantity = 5  # type: ignore
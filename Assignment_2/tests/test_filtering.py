@@ -5,19 +5,24 @@ Tests predicate-based filtering, range filtering, and filter composition.
 """
 
 from decimal import Decimal
+from itertools import count, islice
+from operator import itemgetter
 
 import pytest
 
 from src.filtering import (
     any_filter,
     compose_filters,
+    date_to_int,
     exclude_by,
     filter_bottom_n,
     filter_by,
+    filter_by_mask,
     filter_date_range,
     filter_empty_strings,
     filter_none,
     filter_range,
+    filter_range_mask,
     filter_top_n,
     filter_unique,
     not_filter,
@@ -54,6 +59,14 @@ def test_exclude_by_all_match() -> None:
     assert result == []
 
 
+def test_filter_by_mask() -> None:
+    """Test mask-based selection keeps elements where the mask is True."""
+    data = ["a", "b", "c", "d"]
+    mask = [True, False, True, False]
+    assert list(filter_by_mask(data, mask)) == ["a", "c"]
+    assert list(filter_by_mask(data, [False] * 4)) == []
+
+
 def test_filter_range_inclusive() -> None:
     """Test range filtering with inclusive bounds."""
     transactions = [
@@ -81,6 +94,18 @@ def test_filter_range_exclusive() -> None:
     assert result == [{"amount": 150}]
 
 
+def test_filter_range_mask() -> None:
+    """Test range mask over a numeric column matches filter_range."""
+    amounts = [50, 100, 150, 200, 250]
+
+    mask = filter_range_mask(amounts, 100, 200)
+    assert mask == [False, True, True, True, False]
+    assert list(filter_by_mask(amounts, mask)) == [100, 150, 200]
+
+    exclusive = filter_range_mask(amounts, 100, 200, inclusive=False)
+    assert exclusive == [False, False, True, False, False]
+
+
 def test_filter_range_with_decimal() -> None:
     """Test range filtering with Decimal values."""
     transactions = [
@@ -110,6 +135,54 @@ def test_filter_date_range() -> None:
     assert result[2]["date"] == "2023-12-25"
 
 
+def test_filter_date_range_custom_format() -> None:
+    """Test date range filtering with a non-ISO date format."""
+    transactions = [{"date": "15/01/2023"}, {"date": "10/01/2024"}]
+    result = list(
+        filter_date_range(
+            transactions, lambda t: t["date"], "01/01/2023", "31/12/2023", "%d/%m/%Y"
+        )
+    )
+    assert result == [{"date": "15/01/2023"}]
+
+
+def test_date_to_int_keys_with_filter_range() -> None:
+    """Test date range filtering on precomputed YYYYMMDD integers."""
+    dates = ["2023-01-15", "2023-06-20", "2023-12-25", "2024-01-10"]
+    keyed = [(date_to_int(d), d) for d in dates]
+    assert keyed[0][0] == 20230115
+
+    result = list(
+        filter_range(
+            keyed, lambda t: t[0], date_to_int("2023-01-01"), date_to_int("2023-12-31")
+        )
+    )
+    assert [d for _, d in result] == dates[:3]
+
+    mask = filter_range_mask([k for k, _ in keyed], 20230101, 20231231)
+    assert mask == [True, True, True, False]
+
+    with pytest.raises(ValueError):
+        date_to_int("2023-13-01")
+
+    # Non-zero-padded dates still parse, as with strptime
+    assert date_to_int("2023-1-5") == 20230105
+
+
+@pytest.mark.parametrize("date_str", ["20230115", "2023-W03-1"])
+def test_non_iso_date_shapes_rejected(date_str) -> None:
+    """Test compact and week dates are rejected on every Python version."""
+    with pytest.raises(ValueError):
+        date_to_int(date_str)
+
+    with pytest.raises(ValueError):
+        list(
+            filter_date_range(
+                [{"date": date_str}], itemgetter("date"), "2023-01-01", "2023-12-31"
+            )
+        )
+
+
 def test_filter_date_range_empty() -> None:
     """Test date range filtering with no matches."""
     transactions = [{"date": "2023-01-15"}, {"date": "2023-06-20"}]
@@ -182,6 +255,12 @@ def test_filter_unique_without_key() -> None:
     assert result == [1, 2, 3, 4, 5]
 
 
+def test_filter_unique_streams_iterators() -> None:
+    """Test unique filtering stays lazy on an unbounded iterator."""
+    assert list(islice(filter_unique(count()), 3)) == [0, 1, 2]
+    assert list(filter_unique(iter([3, 1, 3, 2, 1]))) == [3, 1, 2]
+
+
 def test_filter_unique_with_key() -> None:
     """Test unique filtering with key function."""
     data = [
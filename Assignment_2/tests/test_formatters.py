@@ -5,6 +5,8 @@ Tests formatting functions for currency, numbers, percentages,
 and console output of analysis results.
 """
 
+import io
+from collections.abc import Callable
 from decimal import Decimal
 from typing import Any
 
@@ -34,6 +36,13 @@ from src.formatters import (
 )
 
 
+def _render(func: Callable[..., None], *args: Any, **kwargs: Any) -> str:
+    """Call an output function with an in-memory stream and return its text."""
+    buffer = io.StringIO()
+    func(*args, file=buffer, **kwargs)
+    return buffer.getvalue()
+
+
 # ==============================================================================
 # Basic Formatting Functions Tests
 # ==============================================================================
@@ -138,48 +147,44 @@ def test_format_number_single_digit() -> None:
 
 
 # ==============================================================================
-# Console Output Functions Tests (using capsys to capture stdout)
+# Console Output Functions Tests (rendered into an in-memory stream)
 # ==============================================================================
 
 
-def test_print_section_header_default_width(capsys: pytest.CaptureFixture[str]) -> None:
+def test_print_section_header_default_width() -> None:
     """Test section header printing with default width."""
-    print_section_header("Test Header")
-    captured = capsys.readouterr()
+    out = _render(print_section_header, "Test Header")
 
-    lines = captured.out.strip().split("\n")
+    lines = out.strip().split("\n")
     assert len(lines) == 3
     assert lines[0] == "=" * 80
     assert lines[1] == "Test Header"
     assert lines[2] == "-" * 80
 
 
-def test_print_section_header_custom_width(capsys: pytest.CaptureFixture[str]) -> None:
+def test_print_section_header_custom_width() -> None:
     """Test section header printing with custom width."""
-    print_section_header("Test Header", width=50)
-    captured = capsys.readouterr()
+    out = _render(print_section_header, "Test Header", width=50)
 
-    lines = captured.out.strip().split("\n")
+    lines = out.strip().split("\n")
     assert len(lines) == 3
     assert lines[0] == "=" * 50
     assert lines[1] == "Test Header"
     assert lines[2] == "-" * 50
 
 
-def test_print_separator_default_width(capsys: pytest.CaptureFixture[str]) -> None:
+def test_print_separator_default_width() -> None:
     """Test separator printing with default width."""
-    print_separator()
-    captured = capsys.readouterr()
+    out = _render(print_separator)
 
-    assert captured.out.strip() == "=" * 80
+    assert out.strip() == "=" * 80
 
 
-def test_print_separator_custom_width(capsys: pytest.CaptureFixture[str]) -> None:
+def test_print_separator_custom_width() -> None:
     """Test separator printing with custom width."""
-    print_separator(width=40)
-    captured = capsys.readouterr()
+    out = _render(print_separator, width=40)
 
-    assert captured.out.strip() == "=" * 40
+    assert out.strip() == "=" * 40
 
 
 # ==============================================================================
@@ -187,407 +192,328 @@ def test_print_separator_custom_width(capsys: pytest.CaptureFixture[str]) -> Non
 # ==============================================================================
 
 
-def test_format_analysis_01(capsys: pytest.CaptureFixture[str]) -> None:
-    """Test formatting of Analysis 1 (Revenue by Category)."""
-    result = [
-        ("Electronics", Decimal("1234567.89")),
-        ("Clothing", Decimal("987654.32")),
-    ]
-
-    format_analysis_01(result)
-    captured = capsys.readouterr()
-
-    assert "Analysis 1" in captured.out
-    assert "Electronics" in captured.out
-    assert "Clothing" in captured.out
-    assert "$1,234,567.89" in captured.out
-    assert "$987,654.32" in captured.out
+_ANALYSIS_CASES = [
+    pytest.param(
+        format_analysis_01,
+        [
+            ("Electronics", Decimal("1234567.89")),
+            ("Clothing", Decimal("987654.32")),
+        ],
+        (
+            "Analysis 1",
+            "Electronics",
+            "Clothing",
+            "$1,234,567.89",
+            "$987,654.32",
+        ),
+        id="analysis_01",
+    ),
+    pytest.param(
+        format_analysis_02,
+        [
+            ("PROD-001", "Wireless Headphones", 5432),
+            ("PROD-002", "Yoga Mat", 4876),
+        ],
+        ("Analysis 2", "Rank", "PROD-001", "Wireless Headphones", "5,432"),
+        id="analysis_02",
+    ),
+    pytest.param(
+        format_analysis_03,
+        {
+            "Enterprise": Decimal("1245.67"),
+            "SMB": Decimal("687.89"),
+            "Individual": Decimal("234.56"),
+        },
+        ("Analysis 3", "Enterprise", "$1,245.67"),
+        id="analysis_03",
+    ),
+    pytest.param(
+        format_analysis_04,
+        [
+            ("2023-01", Decimal("100000.00")),
+            ("2023-02", Decimal("150000.00")),
+        ],
+        # "#" checks the bar chart is present
+        ("Analysis 4", "2023-01", "$100,000.00", "#"),
+        id="analysis_04",
+    ),
+    pytest.param(
+        format_analysis_05,
+        {
+            "North": {"Credit Card": Decimal("50000.00"), "Cash": Decimal("30000.00")},
+            "South": {"Debit Card": Decimal("40000.00")},
+        },
+        ("Analysis 5", "North:", "South:", "Credit Card", "$50,000.00"),
+        id="analysis_05",
+    ),
+    pytest.param(
+        format_analysis_06,
+        {
+            "discounted_count": 1000,
+            "non_discounted_count": 2000,
+            "avg_discounted": Decimal("150.00"),
+            "avg_non_discounted": Decimal("200.00"),
+            "percentage_difference": Decimal("-25.00"),
+        },
+        ("Analysis 6", "1,000", "2,000", "$150.00", "$200.00", "-25.00%"),
+        id="analysis_06",
+    ),
+    pytest.param(
+        format_analysis_07,
+        [
+            (
+                "REP-001",
+                {
+                    "total_revenue": Decimal("100000.00"),
+                    "transaction_count": 500,
+                    "avg_deal_size": Decimal("200.00"),
+                },
+            ),
+            (
+                "REP-002",
+                {
+                    "total_revenue": Decimal("80000.00"),
+                    "transaction_count": 400,
+                    "avg_deal_size": Decimal("200.00"),
+                },
+            ),
+        ],
+        ("Analysis 7", "REP-001", "$100,000.00", "500"),
+        id="analysis_07",
+    ),
+    pytest.param(
+        format_analysis_08,
+        {
+            "1 purchase": 100,
+            "2-5 purchases": 50,
+            "6-10 purchases": 20,
+            "10+ purchases": 10,
+        },
+        ("Analysis 8", "1 purchase", "100", "customers"),
+        id="analysis_08",
+    ),
+    pytest.param(
+        format_analysis_09,
+        {
+            "2023": {
+                "Q1": Decimal("100000.00"),
+                "Q2": Decimal("120000.00"),
+                "Q3": Decimal("110000.00"),
+                "Q4": Decimal("130000.00"),
+            },
+            "2024": {
+                "Q1": Decimal("105000.00"),
+                "Q2": Decimal("125000.00"),
+            },
+        },
+        ("Analysis 9", "2023", "2024", "Q1", "$100,000.00"),
+        id="analysis_09",
+    ),
+    pytest.param(
+        format_analysis_10,
+        {
+            "threshold": Decimal("1000.00"),
+            "count": 50,
+            "total_revenue": Decimal("75000.00"),
+            "avg_amount": Decimal("1500.00"),
+            "top_category": "Electronics",
+            "top_region": "North",
+            "top_payment": "Credit Card",
+        },
+        ("Analysis 10", "$1,000.00", "50", "Electronics", "North"),
+        id="analysis_10",
+    ),
+    pytest.param(
+        format_analysis_11,
+        {
+            "North": {"Electronics": 45.5, "Clothing": 30.2, "Books": 24.3},
+            "South": {"Electronics": 50.0, "Clothing": 50.0},
+        },
+        # "#" checks the bar chart is present
+        ("Analysis 11", "North:", "South:", "Electronics", "45.50%", "#"),
+        id="analysis_11",
+    ),
+    pytest.param(
+        format_analysis_12,
+        [
+            (
+                "CUST-00001",
+                {
+                    "total_revenue": Decimal("50000.00"),
+                    "transaction_count": 100,
+                    "avg_order_value": Decimal("500.00"),
+                },
+            ),
+            (
+                "CUST-00002",
+                {
+                    "total_revenue": Decimal("40000.00"),
+                    "transaction_count": 80,
+                    "avg_order_value": Decimal("500.00"),
+                },
+            ),
+        ],
+        ("Analysis 12", "CUST-00001", "$50,000.00", "100"),
+        id="analysis_12",
+    ),
+    pytest.param(
+        format_analysis_13,
+        {
+            "Enterprise": {"preferred_method": "Credit Card", "usage_percentage": 75.5},
+            "SMB": {"preferred_method": "Debit Card", "usage_percentage": 60.2},
+            "Individual": {"preferred_method": "Cash", "usage_percentage": 45.8},
+        },
+        ("Analysis 13", "Enterprise", "Credit Card", "75.50%"),
+        id="analysis_13",
+    ),
+    pytest.param(
+        format_analysis_14,
+        {
+            "Under $50": {"count": 1000, "revenue": Decimal("25000.00")},
+            "$50-$200": {"count": 500, "revenue": Decimal("75000.00")},
+            "$200-$1000": {"count": 200, "revenue": Decimal("100000.00")},
+            "$1000+": {"count": 50, "revenue": Decimal("75000.00")},
+        },
+        ("Analysis 14", "Under $50", "1,000", "$25,000.00"),
+        id="analysis_14",
+    ),
+]
 
 
-def test_format_analysis_01_empty(capsys: pytest.CaptureFixture[str]) -> None:
-    """Test formatting of Analysis 1 with empty results."""
-    format_analysis_01([])
-    captured = capsys.readouterr()
+@pytest.mark.parametrize("formatter, result, expected", _ANALYSIS_CASES)
+def test_format_analysis(
+    formatter: Callable[[Any], None],
+    result: Any,
+    expected: tuple[str, ...],
+) -> None:
+    """Test each analysis formatter prints its header and key values."""
+    out = _render(formatter, result)
 
-    assert "Analysis 1" in captured.out
+    missing = [text for text in expected if text not in out]
+    assert not missing, f"{formatter.__name__} output lacks {missing}"
 
 
-def test_format_analysis_02(capsys: pytest.CaptureFixture[str]) -> None:
-    """Test formatting of Analysis 2 (Top Products)."""
-    result = [
-        ("PROD-001", "Wireless Headphones", 5432),
-        ("PROD-002", "Yoga Mat", 4876),
-    ]
+def test_format_analysis_01_to_stream(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test formatting into an explicit stream instead of stdout."""
+    buffer = io.StringIO()
 
-    format_analysis_02(result)
-    captured = capsys.readouterr()
+    format_analysis_01([("Electronics", Decimal("1234567.89"))], file=buffer)
 
-    assert "Analysis 2" in captured.out
-    assert "Rank" in captured.out
-    assert "PROD-001" in captured.out
-    assert "Wireless Headphones" in captured.out
-    assert "5,432" in captured.out
+    assert capsys.readouterr().out == ""
+    assert "Analysis 1" in buffer.getvalue()
+    assert "$1,234,567.89" in buffer.getvalue()
 
 
-def test_format_analysis_02_truncates_long_names(
-    capsys: pytest.CaptureFixture[str]
-) -> None:
+def test_format_analysis_02_truncates_long_names() -> None:
     """Test that Analysis 2 truncates very long product names."""
     result = [("PROD-001", "A" * 50, 100)]
 
-    format_analysis_02(result)
-    captured = capsys.readouterr()
+    out = _render(format_analysis_02, result)
 
     # Should truncate to 28 characters
-    assert "A" * 28 in captured.out
-
-
-def test_format_analysis_03(capsys: pytest.CaptureFixture[str]) -> None:
-    """Test formatting of Analysis 3 (Average Transaction by Segment)."""
-    result = {
-        "Enterprise": Decimal("1245.67"),
-        "SMB": Decimal("687.89"),
-        "Individual": Decimal("234.56"),
-    }
-
-    format_analysis_03(result)
-    captured = capsys.readouterr()
-
-    assert "Analysis 3" in captured.out
-    assert "Enterprise" in captured.out
-    assert "$1,245.67" in captured.out
-
-
-def test_format_analysis_04(capsys: pytest.CaptureFixture[str]) -> None:
-    """Test formatting of Analysis 4 (Monthly Sales Trend)."""
-    result = [
-        ("2023-01", Decimal("100000.00")),
-        ("2023-02", Decimal("150000.00")),
-    ]
+    assert "A" * 28 in out
 
-    format_analysis_04(result)
-    captured = capsys.readouterr()
 
-    assert "Analysis 4" in captured.out
-    assert "2023-01" in captured.out
-    assert "$100,000.00" in captured.out
-    assert "#" in captured.out  # Bar chart should be present
-
-
-def test_format_analysis_05(capsys: pytest.CaptureFixture[str]) -> None:
-    """Test formatting of Analysis 5 (Revenue by Region and Payment)."""
-    result = {
-        "North": {"Credit Card": Decimal("50000.00"), "Cash": Decimal("30000.00")},
-        "South": {"Debit Card": Decimal("40000.00")},
-    }
-
-    format_analysis_05(result)
-    captured = capsys.readouterr()
-
-    assert "Analysis 5" in captured.out
-    assert "North:" in captured.out
-    assert "South:" in captured.out
-    assert "Credit Card" in captured.out
-    assert "$50,000.00" in captured.out
-
-
-def test_format_analysis_06(capsys: pytest.CaptureFixture[str]) -> None:
-    """Test formatting of Analysis 6 (Discount Impact)."""
-    result = {
-        "discounted_count": 1000,
-        "non_discounted_count": 2000,
-        "avg_discounted": Decimal("150.00"),
-        "avg_non_discounted": Decimal("200.00"),
-        "percentage_difference": Decimal("-25.00"),
-    }
-
-    format_analysis_06(result)
-    captured = capsys.readouterr()
-
-    assert "Analysis 6" in captured.out
-    assert "1,000" in captured.out
-    assert "2,000" in captured.out
-    assert "$150.00" in captured.out
-    assert "$200.00" in captured.out
-    assert "-25.00%" in captured.out
-
-
-def test_format_analysis_07(capsys: pytest.CaptureFixture[str]) -> None:
-    """Test formatting of Analysis 7 (Sales Rep Performance)."""
-    result = [
-        (
-            "REP-001",
-            {
-                "total_revenue": Decimal("100000.00"),
-                "transaction_count": 500,
-                "avg_deal_size": Decimal("200.00"),
-            },
-        ),
-        (
-            "REP-002",
-            {
-                "total_revenue": Decimal("80000.00"),
-                "transaction_count": 400,
-                "avg_deal_size": Decimal("200.00"),
-            },
-        ),
-    ]
-
-    format_analysis_07(result)
-    captured = capsys.readouterr()
-
-    assert "Analysis 7" in captured.out
-    assert "REP-001" in captured.out
-    assert "$100,000.00" in captured.out
-    assert "500" in captured.out
-
-
-def test_format_analysis_08(capsys: pytest.CaptureFixture[str]) -> None:
-    """Test formatting of Analysis 8 (Customer Purchase Frequency)."""
-    result = {
-        "1 purchase": 100,
-        "2-5 purchases": 50,
-        "6-10 purchases": 20,
-        "10+ purchases": 10,
-    }
-
-    format_analysis_08(result)
-    captured = capsys.readouterr()
-
-    assert "Analysis 8" in captured.out
-    assert "1 purchase" in captured.out
-    assert "100" in captured.out
-    assert "customers" in captured.out
-
-
-def test_format_analysis_08_missing_categories(
-    capsys: pytest.CaptureFixture[str]
-) -> None:
+def test_format_analysis_08_missing_categories() -> None:
     """Test Analysis 8 handles missing frequency categories gracefully."""
     result = {"1 purchase": 100}  # Only one category
 
-    format_analysis_08(result)
-    captured = capsys.readouterr()
+    out = _render(format_analysis_08, result)
 
     # Should still print all categories, missing ones as 0
-    assert "Analysis 8" in captured.out
-    assert "0 customers" in captured.out
-
-
-def test_format_analysis_09(capsys: pytest.CaptureFixture[str]) -> None:
-    """Test formatting of Analysis 9 (Seasonal Sales Pattern)."""
-    result = {
-        "2023": {
-            "Q1": Decimal("100000.00"),
-            "Q2": Decimal("120000.00"),
-            "Q3": Decimal("110000.00"),
-            "Q4": Decimal("130000.00"),
-        },
-        "2024": {
-            "Q1": Decimal("105000.00"),
-            "Q2": Decimal("125000.00"),
-        },
-    }
-
-    format_analysis_09(result)
-    captured = capsys.readouterr()
-
-    assert "Analysis 9" in captured.out
-    assert "2023" in captured.out
-    assert "2024" in captured.out
-    assert "Q1" in captured.out
-    assert "$100,000.00" in captured.out
+    assert "Analysis 8" in out
+    assert "0 customers" in out
 
 
-def test_format_analysis_10_with_results(capsys: pytest.CaptureFixture[str]) -> None:
-    """Test formatting of Analysis 10 (High-Value Transactions) with results."""
-    result = {
-        "threshold": Decimal("1000.00"),
-        "count": 50,
-        "total_revenue": Decimal("75000.00"),
-        "avg_amount": Decimal("1500.00"),
-        "top_category": "Electronics",
-        "top_region": "North",
-        "top_payment": "Credit Card",
-    }
-
-    format_analysis_10(result)
-    captured = capsys.readouterr()
-
-    assert "Analysis 10" in captured.out
-    assert "$1,000.00" in captured.out
-    assert "50" in captured.out
-    assert "Electronics" in captured.out
-    assert "North" in captured.out
-
-
-def test_format_analysis_10_no_results(capsys: pytest.CaptureFixture[str]) -> None:
+def test_format_analysis_10_no_results() -> None:
     """Test formatting of Analysis 10 with no high-value transactions."""
     result = {
         "threshold": Decimal("10000.00"),
         "count": 0,
     }
 
-    format_analysis_10(result)
-    captured = capsys.readouterr()
+    out = _render(format_analysis_10, result)
 
-    assert "Analysis 10" in captured.out
-    assert "0" in captured.out
+    assert "Analysis 10" in out
+    assert "0" in out
     # Should not show category, region, payment info when count is 0
-    assert "Most Common Category" not in captured.out
+    assert "Most Common Category" not in out
 
 
-def test_format_analysis_11(capsys: pytest.CaptureFixture[str]) -> None:
-    """Test formatting of Analysis 11 (Category Mix by Region)."""
-    result = {
-        "North": {"Electronics": 45.5, "Clothing": 30.2, "Books": 24.3},
-        "South": {"Electronics": 50.0, "Clothing": 50.0},
+def test_format_analysis_14_missing_ranges() -> None:
+    """Test Analysis 14 handles missing price ranges gracefully."""
+    result: dict[str, dict[str, Any]] = {
+        "Under $50": {"count": 100, "revenue": Decimal("2500.00")},
+        # Missing other ranges
     }
 
-    format_analysis_11(result)
-    captured = capsys.readouterr()
+    out = _render(format_analysis_14, result)
 
-    assert "Analysis 11" in captured.out
-    assert "North:" in captured.out
-    assert "South:" in captured.out
-    assert "Electronics" in captured.out
-    assert "45.50%" in captured.out
-    assert "#" in captured.out  # Bar chart should be present
+    assert "Analysis 14" in out
+    assert "Under $50" in out
+    # Should not crash with missing ranges
 
 
-def test_format_analysis_12(capsys: pytest.CaptureFixture[str]) -> None:
-    """Test formatting of Analysis 12 (Customer Lifetime Value)."""
-    result = [
-        (
-            "CUST-00001",
+@pytest.mark.parametrize(
+    "kwargs, expected, unexpected",
+    [
+        pytest.param(
             {
-                "total_revenue": Decimal("50000.00"),
-                "transaction_count": 100,
-                "avg_order_value": Decimal("500.00"),
+                "total_transactions": 25000,
+                "total_revenue": Decimal("21371482.11"),
+                "date_range": ("2023-01-01", "2024-12-31"),
+                "execution_time": 0.847,
             },
+            (
+                "SUMMARY",
+                "25,000",
+                "$21,371,482.11",
+                "2023-01-01",
+                "2024-12-31",
+                "0.847 seconds",
+                "14/14",
+            ),
+            (),
+            id="normal",
         ),
-        (
-            "CUST-00002",
+        # Should not calculate average transaction when count is 0
+        pytest.param(
             {
-                "total_revenue": Decimal("40000.00"),
-                "transaction_count": 80,
-                "avg_order_value": Decimal("500.00"),
+                "total_transactions": 0,
+                "total_revenue": Decimal("0.00"),
+                "date_range": ("2023-01-01", "2023-12-31"),
+                "execution_time": 0.001,
             },
+            ("SUMMARY", "0", "$0.00"),
+            ("Average Transaction",),
+            id="zero_transactions",
         ),
-    ]
-
-    format_analysis_12(result)
-    captured = capsys.readouterr()
-
-    assert "Analysis 12" in captured.out
-    assert "CUST-00001" in captured.out
-    assert "$50,000.00" in captured.out
-    assert "100" in captured.out
-
-
-def test_format_analysis_13(capsys: pytest.CaptureFixture[str]) -> None:
-    """Test formatting of Analysis 13 (Payment Preference by Segment)."""
-    result = {
-        "Enterprise": {"preferred_method": "Credit Card", "usage_percentage": 75.5},
-        "SMB": {"preferred_method": "Debit Card", "usage_percentage": 60.2},
-        "Individual": {"preferred_method": "Cash", "usage_percentage": 45.8},
-    }
-
-    format_analysis_13(result)
-    captured = capsys.readouterr()
-
-    assert "Analysis 13" in captured.out
-    assert "Enterprise" in captured.out
-    assert "Credit Card" in captured.out
-    assert "75.50%" in captured.out
-
-
-def test_format_analysis_14(capsys: pytest.CaptureFixture[str]) -> None:
-    """Test formatting of Analysis 14 (Price Range Distribution)."""
-    result: dict[str, dict[str, Any]] = {
-        "Under $50": {"count": 1000, "revenue": Decimal("25000.00")},
-        "$50-$200": {"count": 500, "revenue": Decimal("75000.00")},
-        "$200-$1000": {"count": 200, "revenue": Decimal("100000.00")},
-        "$1000+": {"count": 50, "revenue": Decimal("75000.00")},
-    }
-
-    format_analysis_14(result)
-    captured = capsys.readouterr()
-
-    assert "Analysis 14" in captured.out
-    assert "Under $50" in captured.out
-    assert "1,000" in captured.out
-    assert "$25,000.00" in captured.out
-
-
-def test_format_analysis_14_missing_ranges(capsys: pytest.CaptureFixture[str]) -> None:
-    """Test Analysis 14 handles missing price ranges gracefully."""
-    result: dict[str, dict[str, Any]] = {
-        "Under $50": {"count": 100, "revenue": Decimal("2500.00")},
-        # Missing other ranges
-    }
-
-    format_analysis_14(result)
-    captured = capsys.readouterr()
-
-    assert "Analysis 14" in captured.out
-    assert "Under $50" in captured.out
-    # Should not crash with missing ranges
-
-
-def test_print_overall_summary(capsys: pytest.CaptureFixture[str]) -> None:
-    """Test overall summary printing."""
-    print_overall_summary(
-        total_transactions=25000,
-        total_revenue=Decimal("21371482.11"),
-        date_range=("2023-01-01", "2024-12-31"),
-        execution_time=0.847,
-    )
-    captured = capsys.readouterr()
-
-    assert "SUMMARY" in captured.out
-    assert "25,000" in captured.out
-    assert "$21,371,482.11" in captured.out
-    assert "2023-01-01" in captured.out
-    assert "2024-12-31" in captured.out
-    assert "0.847 seconds" in captured.out
-    assert "14/14" in captured.out
-
-
-def test_print_overall_summary_zero_transactions(
-    capsys: pytest.CaptureFixture[str]
-) -> None:
-    """Test overall summary with zero transactions."""
-    print_overall_summary(
-        total_transactions=0,
-        total_revenue=Decimal("0.00"),
-        date_range=("2023-01-01", "2023-12-31"),
-        execution_time=0.001,
-    )
-    captured = capsys.readouterr()
-
-    assert "SUMMARY" in captured.out
-    assert "0" in captured.out
-    assert "$0.00" in captured.out
-    # Should not calculate average transaction when count is 0
-    assert "Average Transaction" not in captured.out
-
-
-def test_print_overall_summary_calculates_average(
-    capsys: pytest.CaptureFixture[str]
+        # 100000 / 1000 = 100
+        pytest.param(
+            {
+                "total_transactions": 1000,
+                "total_revenue": Decimal("100000.00"),
+                "date_range": ("2023-01-01", "2023-12-31"),
+                "execution_time": 0.5,
+            },
+            ("Average Transaction", "$100.00"),
+            (),
+            id="calculates_average",
+        ),
+    ],
+)
+def test_print_overall_summary(
+    kwargs: dict[str, Any],
+    expected: tuple[str, ...],
+    unexpected: tuple[str, ...],
 ) -> None:
-    """Test that overall summary calculates and displays average transaction."""
-    print_overall_summary(
-        total_transactions=1000,
-        total_revenue=Decimal("100000.00"),
-        date_range=("2023-01-01", "2023-12-31"),
-        execution_time=0.5,
-    )
-    captured = capsys.readouterr()
+    """Test overall summary printing."""
+    out = _render(print_overall_summary, **kwargs)
 
-    assert "Average Transaction" in captured.out
-    # 100000 / 1000 = 100
-    assert "$100.00" in captured.out
+    missing = [text for text in expected if text not in out]
+    assert not missing, f"summary output lacks {missing}"
+    present = [text for text in unexpected if text in out]
+    assert not present, f"summary output should not contain {present}"
 
 
 # ==============================================================================
@@ -595,40 +521,7 @@ def test_print_overall_summary_calculates_average(
 # ==============================================================================
 
 
-def test_format_analysis_02_empty(capsys: pytest.CaptureFixture[str]) -> None:
-    """Test Analysis 2 with empty results."""
-    format_analysis_02([])
-    captured = capsys.readouterr()
-
-    assert "Analysis 2" in captured.out
-    # Should print header but no data rows
-
-
-def test_format_analysis_03_empty(capsys: pytest.CaptureFixture[str]) -> None:
-    """Test Analysis 3 with empty results."""
-    format_analysis_03({})
-    captured = capsys.readouterr()
-
-    assert "Analysis 3" in captured.out
-
-
-def test_format_analysis_05_empty(capsys: pytest.CaptureFixture[str]) -> None:
-    """Test Analysis 5 with empty results."""
-    format_analysis_05({})
-    captured = capsys.readouterr()
-
-    assert "Analysis 5" in captured.out
-
-
-def test_format_analysis_07_empty(capsys: pytest.CaptureFixture[str]) -> None:
-    """Test Analysis 7 with empty results."""
-    format_analysis_07([])
-    captured = capsys.readouterr()
-
-    assert "Analysis 7" in captured.out
-
-
-def test_format_analysis_09_partial_quarters(capsys: pytest.CaptureFixture[str]) -> None:
+def test_format_analysis_09_partial_quarters() -> None:
     """Test Analysis 9 handles missing quarters gracefully."""
     result = {
         "2023": {
@@ -637,34 +530,30 @@ def test_format_analysis_09_partial_quarters(capsys: pytest.CaptureFixture[str])
         }
     }
 
-    format_analysis_09(result)
-    captured = capsys.readouterr()
+    out = _render(format_analysis_09, result)
 
-    assert "Analysis 9" in captured.out
-    assert "2023" in captured.out
+    assert "Analysis 9" in out
+    assert "2023" in out
     # Should show $0.00 for missing quarters
 
 
-def test_format_analysis_11_empty(capsys: pytest.CaptureFixture[str]) -> None:
-    """Test Analysis 11 with empty results."""
-    format_analysis_11({})
-    captured = capsys.readouterr()
-
-    assert "Analysis 11" in captured.out
-
-
-def test_format_analysis_12_empty(capsys: pytest.CaptureFixture[str]) -> None:
-    """Test Analysis 12 with empty results."""
-    format_analysis_12([])
-    captured = capsys.readouterr()
-
-    assert "Analysis 12" in captured.out
-
-
-def test_format_analysis_13_empty(capsys: pytest.CaptureFixture[str]) -> None:
-    """Test Analysis 13 with empty results."""
-    format_analysis_13({})
-    captured = capsys.readouterr()
-
-    assert "Analysis 13" in captured.out
-
+@pytest.mark.parametrize(
+    "formatter, empty, header",
+    [
+        pytest.param(format_analysis_01, [], "Analysis 1", id="analysis_01"),
+        pytest.param(format_analysis_02, [], "Analysis 2", id="analysis_02"),
+        pytest.param(format_analysis_03, {}, "Analysis 3", id="analysis_03"),
+        pytest.param(format_analysis_05, {}, "Analysis 5", id="analysis_05"),
+        pytest.param(format_analysis_07, [], "Analysis 7", id="analysis_07"),
+        pytest.param(format_analysis_11, {}, "Analysis 11", id="analysis_11"),
+        pytest.param(format_analysis_12, [], "Analysis 12", id="analysis_12"),
+        pytest.param(format_analysis_13, {}, "Analysis 13", id="analysis_13"),
+    ],
+)
+def test_format_analysis_empty(
+    formatter: Callable[[Any], None],
+    empty: Any,
+    header: str,
+) -> None:
+    """Test analysis formatters print their header for empty results."""
+    assert header in _render(formatter, empty)
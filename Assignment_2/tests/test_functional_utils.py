@@ -4,6 +4,12 @@ Unit Tests for Functional Utilities Module.
 Tests function composition, currying, and helper functions.
 """
 
+import operator
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import pytest
+
 from src.functional_utils import (
     accumulate_with,
     apply_to_pairs,
@@ -25,147 +31,149 @@ from src.functional_utils import (
     zip_with,
 )
 
-
-def test_compose() -> None:
-    """Test function composition (right-to-left)."""
-    add_one = lambda x: x + 1
-    double = lambda x: x * 2
-
-    # compose(double, add_one)(5) = double(add_one(5)) = double(6) = 12
-    composed = compose(double, add_one)
-    assert composed(5) == 12
-
-
-def test_compose_multiple() -> None:
-    """Test composing multiple functions."""
-    add_one = lambda x: x + 1
-    double = lambda x: x * 2
-    square = lambda x: x * x
-
-    # compose(square, double, add_one)(3) = square(double(add_one(3))) = square(double(4)) = square(8) = 64
-    composed = compose(square, double, add_one)
-    assert composed(3) == 64
-
-
-def test_pipe() -> None:
-    """Test function composition (left-to-right)."""
-    add_one = lambda x: x + 1
-    double = lambda x: x * 2
-
-    # pipe(add_one, double)(5) = double(add_one(5)) = double(6) = 12
-    piped = pipe(add_one, double)
-    assert piped(5) == 12
-
-
-def test_identity() -> None:
-    """Test identity function."""
-    assert identity(5) == 5
-    assert identity("hello") == "hello"
-    assert identity([1, 2, 3]) == [1, 2, 3]
-
-
-def test_const() -> None:
-    """Test constant function."""
-    always_five = const(5)
-    assert always_five() == 5
-    assert always_five(1, 2, 3) == 5
-    assert always_five(x=10, y=20) == 5
-
-
-def test_flip() -> None:
-    """Test flipping function arguments."""
-
-    def subtract(x: int, y: int) -> int:
-        return x - y
-
-    flipped_subtract = flip(subtract)
-
-    assert subtract(10, 3) == 7
-    assert flipped_subtract(3, 10) == 7
-
-
-def test_take() -> None:
+_add_one = lambda x: x + 1
+_double = lambda x: x * 2
+_square = lambda x: x * x
+_subtract = lambda x, y: x - y
+
+
+@pytest.mark.parametrize(
+    "func, args, kwargs, expected",
+    [
+        # compose(double, add_one)(5) = double(add_one(5)) = double(6) = 12
+        pytest.param(compose(_double, _add_one), (5,), {}, 12, id="compose"),
+        # square(double(add_one(3))) = square(double(4)) = square(8) = 64
+        pytest.param(
+            compose(_square, _double, _add_one), (3,), {}, 64, id="compose_multiple"
+        ),
+        # pipe(add_one, double)(5) = double(add_one(5)) = double(6) = 12
+        pytest.param(pipe(_add_one, _double), (5,), {}, 12, id="pipe"),
+        pytest.param(identity, (5,), {}, 5, id="identity_int"),
+        pytest.param(identity, ("hello",), {}, "hello", id="identity_str"),
+        pytest.param(identity, ([1, 2, 3],), {}, [1, 2, 3], id="identity_list"),
+        pytest.param(const(5), (), {}, 5, id="const_no_args"),
+        pytest.param(const(5), (1, 2, 3), {}, 5, id="const_args"),
+        pytest.param(const(5), (), {"x": 10, "y": 20}, 5, id="const_kwargs"),
+        # flip(subtract)(3, 10) = subtract(10, 3) = 7
+        pytest.param(flip(_subtract), (3, 10), {}, 7, id="flip"),
+    ],
+)
+def test_higher_order(
+    func: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    expected: Any,
+) -> None:
+    """Test composition and combinator helpers on simple lambdas."""
+    assert func(*args, **kwargs) == expected
+
+
+@pytest.mark.parametrize(
+    "n, data, expected",
+    [
+        (3, [1, 2, 3, 4, 5], [1, 2, 3]),
+        (2, [1], [1]),
+        (5, [1, 2], [1, 2]),
+        (0, [1, 2, 3], []),
+    ],
+)
+def test_take(n: int, data: list[int], expected: list[int]) -> None:
     """Test taking first n elements."""
-    assert take(3, [1, 2, 3, 4, 5]) == [1, 2, 3]
-    assert take(2, [1]) == [1]
-    assert take(5, [1, 2]) == [1, 2]
-    assert take(0, [1, 2, 3]) == []
+    assert take(n, data) == expected
 
 
-def test_drop() -> None:
+@pytest.mark.parametrize(
+    "n, data, expected",
+    [
+        (2, [1, 2, 3, 4, 5], [3, 4, 5]),
+        (1, [1], []),
+        (0, [1, 2, 3], [1, 2, 3]),
+        (5, [1, 2], []),
+    ],
+)
+def test_drop(n: int, data: list[int], expected: list[int]) -> None:
     """Test dropping first n elements."""
-    assert list(drop(2, [1, 2, 3, 4, 5])) == [3, 4, 5]
-    assert list(drop(1, [1])) == []
-    assert list(drop(0, [1, 2, 3])) == [1, 2, 3]
-    assert list(drop(5, [1, 2])) == []
+    assert list(drop(n, data)) == expected
 
 
-def test_flatten() -> None:
+@pytest.mark.parametrize(
+    "nested, expected",
+    [
+        ([[1, 2], [3, 4], [5]], [1, 2, 3, 4, 5]),
+        ([[], [1], [], [2, 3]], [1, 2, 3]),
+        ([[]], []),
+    ],
+)
+def test_flatten(nested: list[list[int]], expected: list[int]) -> None:
     """Test flattening nested iterables."""
-    assert list(flatten([[1, 2], [3, 4], [5]])) == [1, 2, 3, 4, 5]
-    assert list(flatten([[], [1], [], [2, 3]])) == [1, 2, 3]
-    assert list(flatten([[]])) == []
+    assert list(flatten(nested)) == expected
 
 
-def test_unique() -> None:
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ([1, 2, 2, 3, 1, 4], [1, 2, 3, 4]),
+        ([1, 1, 1], [1]),
+        ([], []),
+        ([1, 2, 3], [1, 2, 3]),
+    ],
+)
+def test_unique(data: list[int], expected: list[int]) -> None:
     """Test getting unique elements."""
-    assert unique([1, 2, 2, 3, 1, 4]) == [1, 2, 3, 4]
-    assert unique([1, 1, 1]) == [1]
-    assert unique([]) == []
-    assert unique([1, 2, 3]) == [1, 2, 3]
-
-
-def test_partition() -> None:
+    assert unique(data) == expected
+
+
+@pytest.mark.parametrize(
+    "predicate, data, matching, non_matching",
+    [
+        pytest.param(
+            lambda x: x % 2 == 0, [1, 2, 3, 4, 5, 6], [2, 4, 6], [1, 3, 5], id="mixed"
+        ),
+        pytest.param(lambda x: x > 0, [1, 2, 3, 4], [1, 2, 3, 4], [], id="all_true"),
+        pytest.param(lambda x: x < 0, [1, 2, 3, 4], [], [1, 2, 3, 4], id="all_false"),
+    ],
+)
+def test_partition(
+    predicate: Callable[[int], bool],
+    data: list[int],
+    matching: list[int],
+    non_matching: list[int],
+) -> None:
     """Test partitioning by predicate."""
-    is_even = lambda x: x % 2 == 0
-    evens, odds = partition(is_even, [1, 2, 3, 4, 5, 6])
-
-    assert evens == [2, 4, 6]
-    assert odds == [1, 3, 5]
-
-
-def test_partition_all_true() -> None:
-    """Test partition when all elements match."""
-    is_positive = lambda x: x > 0
-    positive, negative = partition(is_positive, [1, 2, 3, 4])
-
-    assert positive == [1, 2, 3, 4]
-    assert negative == []
-
-
-def test_partition_all_false() -> None:
-    """Test partition when no elements match."""
-    is_negative = lambda x: x < 0
-    negative, non_negative = partition(is_negative, [1, 2, 3, 4])
-
-    assert negative == []
-    assert non_negative == [1, 2, 3, 4]
-
-
-def test_chunk() -> None:
-    """Test chunking iterable."""
-    result = list(chunk([1, 2, 3, 4, 5, 6, 7], 3))
-    assert result == [[1, 2, 3], [4, 5, 6], [7]]
-
-
-def test_chunk_exact_fit() -> None:
-    """Test chunking when size divides evenly."""
-    result = list(chunk([1, 2, 3, 4, 5, 6], 2))
-    assert result == [[1, 2], [3, 4], [5, 6]]
+    assert partition(predicate, data) == (matching, non_matching)
 
 
-def test_apply_to_pairs() -> None:
+@pytest.mark.parametrize("grouper", [chunk, batch])
+@pytest.mark.parametrize(
+    "data, size, expected",
+    [
+        pytest.param([1, 2, 3, 4, 5, 6, 7], 3, [[1, 2, 3], [4, 5, 6], [7]], id="tail"),
+        pytest.param([1, 2, 3, 4, 5, 6], 2, [[1, 2], [3, 4], [5, 6]], id="exact_fit"),
+    ],
+)
+def test_chunk_and_batch(
+    grouper: Callable[[list[int], int], Iterable[list[int]]],
+    data: list[int],
+    size: int,
+    expected: list[list[int]],
+) -> None:
+    """Test splitting an iterable into fixed-size lists."""
+    assert list(grouper(data, size)) == expected
+
+
+@pytest.mark.parametrize(
+    "func, data, expected",
+    [
+        # 5-3, 3-2, 2-1
+        pytest.param(lambda x, y: x - y, [5, 3, 2, 1], [2, 1, 1], id="subtract"),
+        pytest.param(lambda x, y: x + y, [5], [], id="single_element"),
+    ],
+)
+def test_apply_to_pairs(
+    func: Callable[[int, int], int], data: list[int], expected: list[int]
+) -> None:
     """Test applying function to consecutive pairs."""
-    subtract = lambda x, y: x - y
-    result = list(apply_to_pairs(subtract, [5, 3, 2, 1]))
-    assert result == [2, 1, 1]  # 5-3, 3-2, 2-1
-
-
-def test_apply_to_pairs_single_element() -> None:
-    """Test apply_to_pairs with single element."""
-    add = lambda x, y: x + y
-    result = list(apply_to_pairs(add, [5]))
-    assert result == []
+    assert list(apply_to_pairs(func, data)) == expected
 
 
 def test_pairwise() -> None:
@@ -174,22 +182,19 @@ def test_pairwise() -> None:
     assert result == [(1, 2), (2, 3), (3, 4), (4, 5)]
 
 
-def test_sliding_window() -> None:
+@pytest.mark.parametrize(
+    "data, size, expected",
+    [
+        ([1, 2, 3, 4, 5], 3, [(1, 2, 3), (2, 3, 4), (3, 4, 5)]),
+        # Window larger than the input yields nothing
+        ([1, 2], 5, []),
+    ],
+)
+def test_sliding_window(
+    data: list[int], size: int, expected: list[tuple[int, ...]]
+) -> None:
     """Test sliding window."""
-    result = list(sliding_window([1, 2, 3, 4, 5], 3))
-    assert result == [(1, 2, 3), (2, 3, 4), (3, 4, 5)]
-
-
-def test_sliding_window_size_larger_than_list() -> None:
-    """Test sliding window when window size > list size."""
-    result = list(sliding_window([1, 2], 5))
-    assert result == []
-
-
-def test_batch() -> None:
-    """Test batching elements."""
-    result = list(batch([1, 2, 3, 4, 5, 6, 7], 3))
-    assert result == [[1, 2, 3], [4, 5, 6], [7]]
+    assert list(sliding_window(data, size)) == expected
 
 
 def test_interleave() -> None:
@@ -204,13 +209,47 @@ def test_zip_with() -> None:
     assert result == [11, 22, 33]
 
 
-def test_accumulate_with() -> None:
+@pytest.mark.parametrize(
+    "data, func, initial, expected",
+    [
+        pytest.param(
+            [1, 2, 3, 4], lambda acc, x: acc + x, 0, [0, 1, 3, 6, 10], id="add"
+        ),
+        pytest.param(
+            [2, 3, 4], lambda acc, x: acc * x, 1, [1, 2, 6, 24], id="multiply"
+        ),
+    ],
+)
+def test_accumulate_with(
+    data: list[int],
+    func: Callable[[int, int], int],
+    initial: int,
+    expected: list[int],
+) -> None:
     """Test accumulation with custom function."""
-    result = list(accumulate_with([1, 2, 3, 4], lambda acc, x: acc + x, 0))
-    assert result == [0, 1, 3, 6, 10]
-
-
-def test_accumulate_with_multiply() -> None:
-    """Test accumulation with multiplication."""
-    result = list(accumulate_with([2, 3, 4], lambda acc, x: acc * x, 1))
-    assert result == [1, 2, 6, 24]
+    assert list(accumulate_with(data, func, initial)) == expected
+
+
+@pytest.mark.parametrize(
+    "func, initial",
+    [
+        pytest.param(operator.add, 0, id="add"),
+        pytest.param(operator.mul, 1, id="mul"),
+        pytest.param(max, float("-inf"), id="running_max"),
+        pytest.param(
+            lambda acc, x: [x] if acc is None else acc + [x], None, id="none_seed"
+        ),
+    ],
+)
+def test_accumulate_with_matches_reference_scan(
+    func: Callable[[Any, Any], Any], initial: Any
+) -> None:
+    """Test accumulate_with agrees with an explicit prefix-scan loop."""
+    data = [3, -1, 4, 1, -5, 9, 2, 6]
+
+    expected = [initial]
+    for item in data:
+        expected.append(func(expected[-1], item))
+
+    assert list(accumulate_with(data, func, initial)) == expected
+    assert list(accumulate_with(iter(data), func, initial)) == expected
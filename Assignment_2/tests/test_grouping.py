@@ -4,6 +4,11 @@ Unit Tests for Grouping Operations Module.
 Tests group_by, partition, and related operations.
 """
 
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import pytest
+
 from src.grouping import (
     count_by_key,
     group_and_aggregate,
@@ -15,85 +20,111 @@ from src.grouping import (
     partition_by,
 )
 
+# Shared read-only rows, built once at import. The grouping functions
+# never mutate their input, so tests can reuse these safely.
+SAMPLE_ROWS = (
+    {"region": "North", "category": "A", "value": 100},
+    {"region": "North", "category": "B", "value": 200},
+    {"region": "South", "category": "A", "value": 150},
+    {"region": "North", "category": "A", "value": 120},
+    {"region": "South", "category": "C", "value": 300},
+)
 
-def test_group_by() -> None:
-    """Test basic grouping by key function."""
-    data = [
-        {"category": "A", "value": 100},
-        {"category": "B", "value": 200},
-        {"category": "A", "value": 150},
-        {"category": "C", "value": 300},
-        {"category": "B", "value": 250},
-    ]
-
-    result = group_by(data, lambda d: d["category"])
-
-    assert len(result) == 3
-    assert len(result["A"]) == 2
-    assert len(result["B"]) == 2
-    assert len(result["C"]) == 1
-
-
-def test_group_by_empty() -> None:
-    """Test grouping empty iterable."""
-    result = group_by([], lambda d: d["category"])
-    assert result == {}
+DISCOUNT_ROWS = (
+    {"amount": 100, "has_discount": True},
+    {"amount": 200, "has_discount": False},
+    {"amount": 150, "has_discount": True},
+    {"amount": 250, "has_discount": False},
+)
 
+PEOPLE = (
+    {"id": 1, "name": "Alice"},
+    {"id": 2, "name": "Bob"},
+    {"id": 3, "name": "Charlie"},
+)
 
-def test_group_by_sorted() -> None:
-    """Test grouping with sorting (using itertools.groupby)."""
-    data = [
-        {"category": "B", "value": 2},
-        {"category": "A", "value": 1},
-        {"category": "A", "value": 3},
-        {"category": "C", "value": 5},
-    ]
+AMOUNT_ROWS = (
+    {"category": "A", "amount": 100},
+    {"category": "A", "amount": 150},
+    {"category": "B", "amount": 200},
+    {"category": "B", "amount": 250},
+)
 
-    result = group_by_sorted(data, lambda d: d["category"])
+CATEGORY_ROWS = (
+    {"category": "A"},
+    {"category": "B"},
+    {"category": "A"},
+    {"category": "A"},
+    {"category": "C"},
+    {"category": "B"},
+)
 
-    assert len(result) == 3
-    assert len(result["A"]) == 2
-    assert len(result["B"]) == 1
-    assert len(result["C"]) == 1
 
+@pytest.fixture(scope="module")
+def sample_rows() -> Sequence[dict[str, Any]]:
+    """Rows with region and category keys shared by the grouping tests."""
+    return SAMPLE_ROWS
+
+
+@pytest.mark.parametrize(
+    "grouper, key_funcs, expected_sizes",
+    [
+        pytest.param(
+            group_by,
+            (lambda d: d["category"],),
+            {"A": 3, "B": 1, "C": 1},
+            id="group_by",
+        ),
+        # Uses itertools.groupby after sorting by key
+        pytest.param(
+            group_by_sorted,
+            (lambda d: d["category"],),
+            {"A": 3, "B": 1, "C": 1},
+            id="group_by_sorted",
+        ),
+        # Composite (region, category) keys
+        pytest.param(
+            group_by_multiple,
+            (lambda d: d["region"], lambda d: d["category"]),
+            {
+                ("North", "A"): 2,
+                ("North", "B"): 1,
+                ("South", "A"): 1,
+                ("South", "C"): 1,
+            },
+            id="group_by_multiple",
+        ),
+    ],
+)
+def test_group_sizes(
+    sample_rows: Sequence[dict[str, Any]],
+    grouper: Callable[..., dict[Any, list[dict[str, Any]]]],
+    key_funcs: tuple[Callable[[dict[str, Any]], Any], ...],
+    expected_sizes: dict[Any, int],
+) -> None:
+    """Test grouping functions place each row in the right bucket."""
+    result = grouper(sample_rows, *key_funcs)
 
-def test_group_by_multiple() -> None:
-    """Test grouping by multiple keys (composite key)."""
-    data = [
-        {"region": "North", "category": "A", "value": 100},
-        {"region": "North", "category": "B", "value": 200},
-        {"region": "South", "category": "A", "value": 150},
-        {"region": "North", "category": "A", "value": 120},
-    ]
+    assert {key: len(group) for key, group in result.items()} == expected_sizes
 
-    result = group_by_multiple(data, lambda d: d["region"], lambda d: d["category"])
 
-    assert ("North", "A") in result
-    assert len(result[("North", "A")]) == 2
-    assert ("North", "B") in result
-    assert len(result[("North", "B")]) == 1
-    assert ("South", "A") in result
-    assert len(result[("South", "A")]) == 1
+def test_group_by_empty() -> None:
+    """Test grouping empty iterable."""
+    result = group_by([], lambda d: d["category"])
+    assert result == {}
 
 
-def test_nested_group_by() -> None:
+def test_nested_group_by(sample_rows: Sequence[dict[str, Any]]) -> None:
     """Test nested (hierarchical) grouping."""
-    data = [
-        {"region": "North", "category": "A", "value": 100},
-        {"region": "North", "category": "A", "value": 150},
-        {"region": "North", "category": "B", "value": 200},
-        {"region": "South", "category": "A", "value": 300},
-    ]
-
-    result = nested_group_by(data, lambda d: d["region"], lambda d: d["category"])
+    result = nested_group_by(
+        sample_rows, lambda d: d["region"], lambda d: d["category"]
+    )
 
-    assert "North" in result
-    assert "South" in result
-    assert "A" in result["North"]
-    assert "B" in result["North"]
-    assert len(result["North"]["A"]) == 2
-    assert len(result["North"]["B"]) == 1
-    assert len(result["South"]["A"]) == 1
+    sizes = {
+        region: {category: len(group) for category, group in by_category.items()}
+        for region, by_category in result.items()
+    }
+    assert sizes == {"North": {"A": 2, "B": 1}, "South": {"A": 1, "C": 1}}
 
 
 def test_nested_group_by_single_level() -> None:
@@ -102,22 +133,14 @@ def test_nested_group_by_single_level() -> None:
 
     result = nested_group_by(data, lambda d: d["category"])
 
-    assert "A" in result
-    assert "B" in result
-    assert len(result["A"]) == 1
-    assert len(result["B"]) == 1
+    assert {key: len(group) for key, group in result.items()} == {"A": 1, "B": 1}
 
 
 def test_partition_by() -> None:
     """Test partitioning by predicate."""
-    data = [
-        {"amount": 100, "has_discount": True},
-        {"amount": 200, "has_discount": False},
-        {"amount": 150, "has_discount": True},
-        {"amount": 250, "has_discount": False},
-    ]
-
-    with_discount, without_discount = partition_by(data, lambda d: d["has_discount"])
+    with_discount, without_discount = partition_by(
+        DISCOUNT_ROWS, lambda d: d["has_discount"]
+    )
 
     assert len(with_discount) == 2
     assert len(without_discount) == 2
@@ -127,13 +150,7 @@ def test_partition_by() -> None:
 
 def test_index_by() -> None:
     """Test creating index (lookup table) by key."""
-    data = [
-        {"id": 1, "name": "Alice"},
-        {"id": 2, "name": "Bob"},
-        {"id": 3, "name": "Charlie"},
-    ]
-
-    result = index_by(data, lambda d: d["id"])
+    result = index_by(PEOPLE, lambda d: d["id"])
 
     assert len(result) == 3
     assert result[1]["name"] == "Alice"
@@ -157,15 +174,8 @@ def test_index_by_duplicate_keys() -> None:
 
 def test_group_and_aggregate() -> None:
     """Test grouping with aggregation."""
-    data = [
-        {"category": "A", "amount": 100},
-        {"category": "A", "amount": 150},
-        {"category": "B", "amount": 200},
-        {"category": "B", "amount": 250},
-    ]
-
     result = group_and_aggregate(
-        data,
+        AMOUNT_ROWS,
         key_func=lambda d: d["category"],
         aggregate_func=lambda group: sum(d["amount"] for d in group),
     )
@@ -176,16 +186,7 @@ def test_group_and_aggregate() -> None:
 
 def test_count_by_key() -> None:
     """Test counting occurrences by key."""
-    data = [
-        {"category": "A"},
-        {"category": "B"},
-        {"category": "A"},
-        {"category": "A"},
-        {"category": "C"},
-        {"category": "B"},
-    ]
-
-    result = count_by_key(data, lambda d: d["category"])
+    result = count_by_key(CATEGORY_ROWS, lambda d: d["category"])
 
     assert result["A"] == 3
     assert result["B"] == 2
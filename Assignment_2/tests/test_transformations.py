@@ -4,6 +4,15 @@ Unit Tests for Transformation Operations Module.
 Tests mapping, extraction, projection, and transformation operations.
 """
 
+import itertools
+import random
+import timeit
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable
+from operator import itemgetter
+
+import pytest
+
 from src.transformations import (
     accumulate_with,
     add_computed_field,
@@ -21,6 +30,21 @@ from src.transformations import (
 )
 
 
+def _best_time(func: Callable[[], object]) -> float:
+    """Best-of-repeat time of one call, keeping scheduler noise out of ratios."""
+    return min(timeit.repeat(func, number=1))
+
+
+def _assert_within_ratio(
+    func: Callable[[], object], reference: Callable[[], object], ratio: float
+) -> None:
+    """Assert func's best time is under ratio times the reference's."""
+    measured, baseline = _best_time(func), _best_time(reference)
+    assert (
+        measured < ratio * baseline
+    ), f"{measured:.4f}s is not within {ratio}x of {baseline:.4f}s"
+
+
 def test_map_by() -> None:
     """Test basic mapping transformation."""
     data = [1, 2, 3, 4, 5]
@@ -84,6 +108,29 @@ def test_project_missing_fields() -> None:
     assert result == [{"id": 1, "amount": 100}, {"id": 2}]
 
 
+def test_project_matches_itemgetter_reference() -> None:
+    """Test projection matches an itemgetter reference for 0, 1 and 5 fields."""
+    data = [{f"k{j}": i * j for j in range(10)} for i in range(50)]
+    keys = ("k0", "k2", "k4", "k6", "k8")
+    getter = itemgetter(*keys)
+    assert list(project(data, *keys)) == [dict(zip(keys, getter(t))) for t in data]
+
+    assert list(project(data[:2], "k3")) == [{"k3": 0}, {"k3": 3}]
+    assert list(project(data[:2])) == [{}, {}]
+
+
+@pytest.mark.perf
+def test_project_perf() -> None:
+    """Test project stays within 1.5x of the itemgetter/zip reference."""
+    data = [{f"k{j}": i * j for j in range(10)} for i in range(100_000)]
+    keys = ("k0", "k2", "k4", "k6", "k8")
+    getter = itemgetter(*keys)
+    reference = lambda: [dict(zip(keys, getter(t))) for t in data]
+    assert list(project(data, *keys)) == reference()
+
+    _assert_within_ratio(lambda: list(project(data, *keys)), reference, 1.5)
+
+
 def test_add_computed_field() -> None:
     """Test adding computed field to dictionaries."""
     transactions = [
@@ -107,6 +154,41 @@ def test_add_computed_field_immutability() -> None:
     assert "total" not in original[0]
 
 
+def test_add_computed_field_is_shallow_copy() -> None:
+    """Test output dicts are new top-level dicts sharing nested values."""
+    original = [{"price": 100, "tags": ["sale"]}]
+    result = list(add_computed_field(original, "total", lambda t: t["price"]))
+
+    result[0]["price"] = 0
+    assert original[0]["price"] == 100
+
+    # Nested values are shared, not deep-copied
+    assert result[0]["tags"] is original[0]["tags"]
+
+
+def test_add_computed_field_keeps_mapping_type() -> None:
+    """Test dict subclasses such as OrderedDict keep their type."""
+    original = [OrderedDict(price=100), defaultdict(int, price=50)]
+    result = list(add_computed_field(original, "total", lambda t: t["price"]))
+
+    assert [type(item) for item in result] == [OrderedDict, defaultdict]
+    assert result[1].default_factory is int
+    assert list(result[0]) == ["price", "total"]
+
+
+@pytest.mark.perf
+def test_add_computed_field_perf() -> None:
+    """Test add_computed_field stays close to an inline unpacking comprehension."""
+    data = [{"price": i, "quantity": i % 7} for i in range(100_000)]
+    total = lambda t: t["price"] * t["quantity"]
+    reference = lambda: [{**t, "total": total(t)} for t in data]
+    assert list(add_computed_field(data, "total", total)) == reference()
+
+    _assert_within_ratio(
+        lambda: list(add_computed_field(data, "total", total)), reference, 1.5
+    )
+
+
 def test_flatmap() -> None:
     """Test flatmap operation."""
     data = [[1, 2], [3, 4], [5]]
@@ -128,6 +210,34 @@ def test_flatmap_empty() -> None:
     assert result == [1, 2, 3]
 
 
+def _random_sublists(count: int) -> list[list[float]]:
+    """Build a seeded list of variable-length float sublists."""
+    rng = random.Random(42)
+    return [[rng.random() for _ in range(rng.randint(0, 16))] for _ in range(count)]
+
+
+def test_flatmap_matches_chain_reference() -> None:
+    """Test flatmap on many variable-length sublists matches chain.from_iterable."""
+    data = _random_sublists(10_000)
+    expected = list(itertools.chain.from_iterable(data))
+    assert list(flatmap(data, lambda x: x)) == expected
+
+    # A mapping function that reshapes each element
+    pairs = lambda xs: [(x, -x) for x in xs]
+    expected_pairs = list(itertools.chain.from_iterable(map(pairs, data)))
+    assert list(flatmap(data, pairs)) == expected_pairs
+
+
+@pytest.mark.perf
+def test_flatmap_perf() -> None:
+    """Test flatmap stays within 2x of the chain.from_iterable reference."""
+    data = _random_sublists(100_000)
+    identity = lambda x: x
+    reference = lambda: list(itertools.chain.from_iterable(map(identity, data)))
+
+    _assert_within_ratio(lambda: list(flatmap(data, identity)), reference, 2)
+
+
 def test_enumerate_with() -> None:
     """Test enumeration with default start."""
     data = ["a", "b", "c"]
@@ -188,6 +298,17 @@ def test_pairwise_single_element() -> None:
     assert result == []
 
 
+@pytest.mark.parametrize(
+    "data",
+    [[], [1], [1, 2], list(range(10)), "abcde"],
+    ids=["empty", "single", "two", "ten", "string"],
+)
+def test_pairwise_matches_itertools(data) -> None:
+    """Test pairwise matches itertools.pairwise, including iterator input."""
+    assert list(pairwise(data)) == list(itertools.pairwise(data))
+    assert list(pairwise(iter(data))) == list(itertools.pairwise(data))
+
+
 def test_sliding_window() -> None:
     """Test sliding window operation."""
     data = [1, 2, 3, 4, 5]
@@ -209,6 +330,24 @@ def test_sliding_window_larger_than_data() -> None:
     assert result == []
 
 
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 8])
+def test_sliding_window_matches_slices(size) -> None:
+    """Test sliding window over an iterator matches slicing the full list."""
+    data = list(range(7))
+    expected = [tuple(data[i : i + size]) for i in range(len(data) - size + 1)]
+    assert list(sliding_window(iter(data), size)) == expected
+
+
+@pytest.mark.perf
+def test_sliding_window_is_linear() -> None:
+    """Test 4x the input takes about 4x the time (quadratic would be ~16x)."""
+    n = 100_000
+    count_windows = lambda size: sum(1 for _ in sliding_window(iter(range(size)), 64))
+    assert count_windows(4 * n) == 4 * n - 63
+
+    _assert_within_ratio(lambda: count_windows(4 * n), lambda: count_windows(n), 6)
+
+
 def test_batch() -> None:
     """Test batching elements."""
     data = [1, 2, 3, 4, 5, 6, 7]
@@ -230,6 +369,15 @@ def test_batch_size_one() -> None:
     assert result == [[1], [2], [3]]
 
 
+@pytest.mark.parametrize("make_input", [list, iter], ids=["list", "iterator"])
+def test_batch_non_positive_size(make_input) -> None:
+    """Test size 0 and negative sizes behave the same for lists and iterators."""
+    assert list(batch(make_input([1, 2, 3]), 0)) == []
+
+    with pytest.raises(ValueError, match="non-negative"):
+        list(batch(make_input([1, 2, 3]), -2))
+
+
 def test_interleave() -> None:
     """Test interleaving multiple iterables."""
     a = [1, 2, 3]
@@ -256,6 +404,16 @@ def test_interleave_unequal_lengths() -> None:
     assert result == [1, "a", 2, "b"]
 
 
+@pytest.mark.perf
+def test_interleave_perf() -> None:
+    """Test interleave stays within 1.5x of the chain/zip reference."""
+    a, b, c = range(0, 1_000_000, 3), range(1, 1_000_000, 3), range(2, 1_000_000, 3)
+    reference = lambda: list(itertools.chain.from_iterable(zip(a, b, c)))
+    assert list(interleave(a, b, c)) == reference()
+
+    _assert_within_ratio(lambda: list(interleave(a, b, c)), reference, 1.5)
+
+
 def test_accumulate_with() -> None:
     """Test accumulation with custom function."""
     data = [1, 2, 3, 4]
@@ -270,6 +428,13 @@ def test_accumulate_with_multiplication() -> None:
     assert result == [1, 2, 6, 24]
 
 
+def test_accumulate_with_none_seed() -> None:
+    """Test None is treated as a real initial value, not as no seed."""
+    collect = lambda acc, x: [x] if acc is None else acc + [x]
+    result = list(accumulate_with([1, 2], collect, None))
+    assert result == [None, [1], [1, 2]]
+
+
 def test_accumulate_with_empty() -> None:
     """Test accumulate with empty iterable."""
     result = list(accumulate_with([], lambda acc, x: acc + x, 0))
@@ -287,3 +452,15 @@ def test_complex_pipeline() -> None:
     batched = list(batch(doubled, 2))
 
     assert batched == [[200, 400], [600, 800]]
+
+
+def test_complex_pipeline_list_matches_iterator() -> None:
+    """Test the list fast path of batch matches the generic iterator path."""
+    amounts = [x * 100 for x in range(1, 12)]
+
+    from_list = list(batch(amounts, 3))
+    from_iterator = list(batch(iter(amounts), 3))
+
+    assert from_list == from_iterator
+    assert from_list[-1] == [1000, 1100]
+    assert all(isinstance(group, list) for group in from_list)